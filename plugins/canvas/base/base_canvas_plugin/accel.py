@@ -0,0 +1,126 @@
+# Copyright (C) 2025 Yanone
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Accelerated helpers for shape/node iteration on the draw hot path.
+
+Node data is expected in SoA (structure-of-arrays) layout: parallel
+``xs``/``ys`` coordinate sequences plus an ``offsets`` index where path
+``i`` covers nodes ``offsets[i]:offsets[i + 1]``. See
+base_canvas_plugin.layout for a converter from the shape dicts that
+draw_below/draw_above receive.
+
+When Numba is installed the kernels are JIT-compiled; otherwise the
+pure-Python implementations are used unchanged. Pyodide ships without
+Numba, so the fallback is the common case in the browser.
+"""
+
+import warnings
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    njit = None
+    _HAVE_NUMBA = False
+
+_warned_no_numba = False
+
+
+def _maybe_jit(func):
+    """
+    Compile a kernel with Numba when available, else return it unchanged.
+
+    A one-shot warning notes the fallback so slow sessions are easy to
+    diagnose without spamming the console.
+    """
+    global _warned_no_numba
+    if _HAVE_NUMBA:
+        return njit(cache=True)(func)
+    if not _warned_no_numba:
+        _warned_no_numba = True
+        warnings.warn(
+            "numba not available; base_canvas_plugin.accel falls back to "
+            "pure Python",
+            RuntimeWarning,
+        )
+    return func
+
+
+@_maybe_jit
+def path_bboxes(xs, ys, offsets, out):
+    """
+    Compute per-path bounding boxes over SoA node arrays.
+
+    Args:
+        xs: Flat x coordinates for all paths
+        ys: Flat y coordinates for all paths
+        offsets: Path start indices; path i spans offsets[i]:offsets[i+1]
+        out: Preallocated (n_paths, 4) buffer receiving
+            (min_x, min_y, max_x, max_y) rows
+
+    Returns:
+        The out buffer
+    """
+    n_paths = len(offsets) - 1
+    for p in range(n_paths):
+        start = offsets[p]
+        end = offsets[p + 1]
+        min_x = max_x = xs[start]
+        min_y = max_y = ys[start]
+        for i in range(start + 1, end):
+            x = xs[i]
+            y = ys[i]
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+        out[p][0] = min_x
+        out[p][1] = min_y
+        out[p][2] = max_x
+        out[p][3] = max_y
+    return out
+
+
+@_maybe_jit
+def total_bbox(xs, ys):
+    """
+    Compute the bounding box of all nodes in one pass.
+
+    Args:
+        xs: Flat x coordinates
+        ys: Flat y coordinates
+
+    Returns:
+        Tuple (min_x, min_y, max_x, max_y)
+    """
+    min_x = max_x = xs[0]
+    min_y = max_y = ys[0]
+    for i in range(1, len(xs)):
+        x = xs[i]
+        y = ys[i]
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    return (min_x, min_y, max_x, max_y)
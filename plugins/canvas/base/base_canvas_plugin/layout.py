@@ -0,0 +1,128 @@
+# Copyright (C) 2025 Yanone
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+SoA (structure-of-arrays) packing for layer_data['shapes'].
+
+The shape dicts handed to draw_below/draw_above are array-of-structures:
+every node is a small dict, so per-frame loops pay a dict lookup per
+coordinate. pack_shapes() repacks the nodes once into flat parallel
+buffers (xs, ys, kinds, path_offsets) that loops - and the kernels in
+base_canvas_plugin.accel - can scan linearly.
+"""
+
+from array import array
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Node type codes for the kinds buffer
+NODE_ON_CURVE = 0       # 'c' / 'cs'
+NODE_OFF_CURVE = 1      # 'o'
+NODE_LINE = 2           # 'l' / 'ls'
+NODE_QUAD = 3           # 'q' / 'qs'
+
+_NODE_TYPE_CODES = {
+    'c': NODE_ON_CURVE,
+    'cs': NODE_ON_CURVE,
+    'o': NODE_OFF_CURVE,
+    'l': NODE_LINE,
+    'ls': NODE_LINE,
+    'q': NODE_QUAD,
+    'qs': NODE_QUAD,
+}
+
+# Single-entry cache so draw_below and draw_above in the same frame share
+# one packing. The shapes list is kept as a strong reference, which also
+# guarantees the cached id cannot be reused by a new object.
+_cache_shapes = None
+_cache_packed = None
+
+
+class PackedShapes:
+    """
+    Flat SoA buffers for the path nodes of one shapes list.
+
+    Attributes:
+        xs: Node x coordinates (float buffer)
+        ys: Node y coordinates (float buffer)
+        kinds: Node type codes (int buffer, see NODE_* constants)
+        path_offsets: Path start indices; path i spans
+            path_offsets[i]:path_offsets[i + 1]
+    """
+
+    def __init__(self, xs, ys, kinds, path_offsets):
+        self.xs = xs
+        self.ys = ys
+        self.kinds = kinds
+        self.path_offsets = path_offsets
+
+    @property
+    def num_paths(self):
+        return len(self.path_offsets) - 1
+
+
+def pack_shapes(shapes):
+    """
+    Repack the nodes of all Path shapes into SoA buffers.
+
+    Results are cached for the most recent shapes list, so calling this
+    from both draw_below and draw_above in the same frame packs once.
+
+    Args:
+        shapes: List of shape dictionaries from layer_data['shapes']
+
+    Returns:
+        PackedShapes with numpy arrays when numpy is available, else
+        array('f') / array('b') / array('i') buffers
+    """
+    global _cache_shapes, _cache_packed
+    if shapes is _cache_shapes:
+        return _cache_packed
+
+    xs = array('f')
+    ys = array('f')
+    kinds = array('b')
+    path_offsets = array('i', [0])
+
+    for shape in shapes:
+        nodes = shape.get('nodes')
+        if not nodes and 'Path' in shape:
+            nodes = shape['Path'].get('nodes')
+        if not nodes:
+            continue
+        for node in nodes:
+            if not isinstance(node, dict):
+                continue
+            xs.append(node.get('x', 0))
+            ys.append(node.get('y', 0))
+            kinds.append(_NODE_TYPE_CODES.get(node.get('nodetype'), NODE_LINE))
+        path_offsets.append(len(xs))
+
+    if _np is not None:
+        packed = PackedShapes(
+            _np.frombuffer(xs, dtype=_np.float32) if xs else _np.empty(0, _np.float32),
+            _np.frombuffer(ys, dtype=_np.float32) if ys else _np.empty(0, _np.float32),
+            _np.frombuffer(kinds, dtype=_np.int8) if kinds else _np.empty(0, _np.int8),
+            _np.frombuffer(path_offsets, dtype=_np.int32),
+        )
+    else:
+        packed = PackedShapes(xs, ys, kinds, path_offsets)
+
+    _cache_shapes = shapes
+    _cache_packed = packed
+    return packed
@@ -18,6 +18,93 @@ Base Canvas Plugin Template
 This is a minimal template showing the essential methods for a canvas plugin.
 """
 
+import json
+import time
+from contextlib import contextmanager
+
+# Bind the js module and localStorage once at import time. Under Pyodide
+# this removes the per-call import lookup from the storage hot paths;
+# outside the browser (e.g. in tests) the binding is simply None.
+try:
+    import js as _js
+except ImportError:
+    _js = None
+try:
+    # Worker-hosted Pyodide has a js module but no localStorage, which
+    # raises AttributeError rather than ImportError
+    _localStorage = _js.localStorage if _js is not None else None
+except AttributeError:
+    _localStorage = None
+
+# Bounds used for parameters that declare no min/max
+_NO_BOUNDS = (float('-inf'), float('inf'))
+
+# Sentinel distinguishing "parameter unset" from a stored None
+_MISSING = object()
+
+
+def _clamp(v, lo, hi):
+    """
+    Clamp v to [lo, hi]. Callers pass +-inf for unbounded parameters,
+    so no None checks are needed on the hot path.
+    """
+    return lo if v < lo else hi if v > hi else v
+
+# Set after the first localStorage failure (e.g. privacy mode) so later
+# calls short-circuit instead of repeatedly crossing into JS just to fail
+_storage_broken = False
+
+
+class RenderBudget:
+    """
+    Per-frame time budget for expensive draw methods.
+
+    Plugins that render thousands of primitives cannot finish inside the
+    16 ms frame budget and would stall the pipeline. Create a budget at
+    the top of draw_below/draw_above and bail out when it is exhausted,
+    resuming from the saved index on the next frame:
+
+        def draw_above(self, layer_data, glyph_name, ctx, viewport_manager):
+            budget = RenderBudget(12)
+            shapes = layer_data['shapes']
+            for i in range(self._resume_at, len(shapes)):
+                if budget.exhausted():
+                    self._resume_at = i
+                    return
+                self._draw_shape(ctx, shapes[i])
+            self._resume_at = 0
+
+    This trades overlay latency for a steady frame rate.
+    """
+
+    __slots__ = ('_deadline',)
+
+    def __init__(self, budget_ms=12):
+        """
+        Args:
+            budget_ms: Milliseconds this frame may spend before bailing.
+                Leave headroom below 16 ms for the rest of the pipeline.
+        """
+        self._deadline = time.monotonic() + budget_ms / 1000.0
+
+    def exhausted(self):
+        """
+        Whether the frame budget is used up.
+
+        Returns:
+            True once the deadline has passed
+        """
+        return time.monotonic() >= self._deadline
+
+    def remaining_ms(self):
+        """
+        Milliseconds left in this frame's budget (may be negative).
+
+        Returns:
+            Remaining budget in milliseconds
+        """
+        return (self._deadline - time.monotonic()) * 1000.0
+
 
 class BaseCanvasPlugin:
     """
@@ -26,51 +113,206 @@ class BaseCanvasPlugin:
     Canvas plugins can draw at two different layers:
     - draw_below: Underneath everything (backgrounds, guides)
     - draw_above: Above everything including UI elements
-    
+
     Implement only the methods you need.
+
+    When updating several parameters in response to one gesture (e.g.
+    linked sliders), wrap the updates in a batch so storage is written
+    once instead of once per call:
+
+        with self.batch():
+            self.set_parameter('width', w)
+            self.set_parameter('height', h)
     """
     
+    # Slots keep instances dict-free, which matters under Pyodide where
+    # every per-instance dict allocates on the WASM heap. Subclasses that
+    # add instance attributes get a __dict__ automatically unless they
+    # declare their own __slots__; the cached schema attributes below
+    # stay at class level and need no slots.
+    __slots__ = (
+        '_parameters',
+        '_dirty',
+        '_flush_scheduled',
+        '_flush_proxy',
+        '_in_batch',
+        '_dirty_draw',
+        '_cached_layer',
+        '_blob_key',
+        '_storage_keys',
+        '_bounds',
+        '_schema',
+        '_params_loaded',
+    )
+
     # Plugin metadata (customize these)
     name = "Base Canvas Plugin"
     version = "0.1.0"
-    
+
+    # Class-level cache of the UI element schema. get_ui_elements() is
+    # assumed to be pure, so its result is built once per class instead of
+    # once per instance. Plugins with dynamic schemas can opt out by
+    # setting _ui_elements_cache_enabled = False.
+    _ui_elements_cache = None
+    _ui_elements_cache_enabled = True
+
+    # Per-class parameter schema derived from get_ui_elements(), as a list
+    # of (param_id, type, default, min, max, element) tuples so __init__
+    # runs one tight loop instead of repeated dict lookups per element
+    _param_schema = None
+
+    # Per-class (blob_key, storage_keys, bounds) derived from the schema,
+    # so repeated instantiation shares the tables instead of rebuilding
+    # the dicts every time
+    _derived_cache = None
+
+    # Opt-in draw caching: plugins whose overlays depend only on their
+    # parameters (not on per-frame layer_data) can set cacheable = True
+    # and render into an OffscreenCanvas once, blitting it on subsequent
+    # frames until a parameter change marks the plugin dirty again.
+    cacheable = False
+
+    # Opt-in worker rendering: plugins whose draw methods only use the
+    # arguments they are passed (layer_data, glyph_name, ctx,
+    # viewport_manager) - no DOM access, no js.document, no shared
+    # mutable state - can set worker_safe = True. A host that supports it
+    # may then run the plugin in a worker-hosted Pyodide drawing into a
+    # transferred OffscreenCanvas, keeping heavy overlays off the main
+    # thread. Hosts without worker support ignore the flag.
+    worker_safe = False
+
     def __init__(self):
         """
-        Initialize plugin and automatically load parameters from storage.
-        
-        This will call get_ui_elements() and load saved values or defaults
-        for each UI element into self._parameters dictionary.
+        Initialize plugin metadata and parameter bookkeeping.
+
+        This will call get_ui_elements() to derive the parameter schema.
+        Saved values (or defaults) are loaded lazily on the first
+        get_parameter/set_parameter call, so unused plugins never touch
+        storage.
         """
         self._parameters = {}
-        
-        # Get UI element definitions
-        ui_elements = self.get_ui_elements()
-        
-        # Load each parameter from storage or use default
-        for element in ui_elements:
-            param_id = element.get('id')
-            if param_id:
-                # Try to load from storage
+
+        # Batched storage writes: keys touched since the last flush
+        self._dirty = set()
+        self._flush_scheduled = False
+        self._flush_proxy = None
+        self._in_batch = False
+
+        # Draw caching state (only used when cacheable = True)
+        self._dirty_draw = True
+        self._cached_layer = None
+
+        # Get UI element definitions and derived parameter schema, both
+        # cached per class (see above)
+        cls = type(self)
+        if cls._ui_elements_cache_enabled:
+            ui_elements = cls.__dict__.get('_ui_elements_cache')
+            if ui_elements is None:
+                ui_elements = self.get_ui_elements()
+                cls._ui_elements_cache = ui_elements
+            schema = cls.__dict__.get('_param_schema')
+            if schema is None:
+                schema = self._build_param_schema(ui_elements)
+                cls._param_schema = schema
+        else:
+            ui_elements = self.get_ui_elements()
+            schema = self._build_param_schema(ui_elements)
+
+        # Derived lookup tables, shared per class across instances
+        derived = cls.__dict__.get('_derived_cache') if cls._ui_elements_cache_enabled else None
+        if derived is None:
+            # All parameters of a plugin share one JSON-encoded
+            # localStorage entry, so init costs a single getItem + parse
+            # instead of one boundary crossing per parameter
+            plugin_name = cls.__name__
+            blob_key = f"canvasPlugin.{plugin_name}"
+
+            # Legacy per-parameter keys, still used to migrate old entries
+            storage_keys = {
+                param_id: f"canvasPlugin.{plugin_name}.{param_id}"
+                for param_id, _type, _default, _lo, _hi, _element in schema
+            }
+
+            # Clamp bounds (defaulting to +-inf) so the load paths can
+            # call _clamp without None checks
+            bounds = {
+                param_id: (lo, hi)
+                for param_id, _type, _default, lo, hi, _element in schema
+            }
+            derived = (blob_key, storage_keys, bounds)
+            if cls._ui_elements_cache_enabled:
+                cls._derived_cache = derived
+
+        self._blob_key, self._storage_keys, self._bounds = derived
+
+        # Storage is only read on first parameter access, so plugins that
+        # are installed but never activated in a session cost no reads
+        self._schema = schema
+        self._params_loaded = False
+
+    def _ensure_parameters_loaded(self):
+        """
+        Load parameters from storage on first access.
+
+        Deferred out of __init__ so instantiating a plugin that is never
+        activated performs no storage reads at all.
+        """
+        if self._params_loaded:
+            return
+        self._params_loaded = True
+
+        stored = self._load_parameters_blob()
+        migrated = False
+
+        # Load each parameter from the blob (or legacy entry) or use default
+        for param_id, _element_type, default, _lo, _hi, element in self._schema:
+            if stored is not None and param_id in stored:
+                loaded_value = self._validate_stored_value(stored[param_id], element)
+            else:
+                # Fall back to the legacy per-parameter entry
                 loaded_value = self._load_parameter_from_storage(param_id, element)
-                
-                # Use loaded value or fall back to default
                 if loaded_value is not None:
-                    self._parameters[param_id] = loaded_value
-                else:
-                    # Get appropriate default based on type
-                    element_type = element.get('type', 'slider')
-                    if element_type == 'checkbox':
-                        default_value = element.get('default', False)
-                    elif element_type == 'textfield':
-                        default_value = element.get('default', '')
-                    elif element_type == 'radio':
-                        default_value = element.get('default', '')
-                    elif element_type == 'color':
-                        default_value = element.get('default', '#000000')
-                    else:  # slider or numeric
-                        default_value = element.get('default', 0)
-                    self._parameters[param_id] = default_value
-    
+                    migrated = True
+
+            self._parameters[param_id] = default if loaded_value is None else loaded_value
+
+        # Persist migrated legacy entries under the new blob key
+        if migrated:
+            self._save_parameters_to_storage()
+
+    @staticmethod
+    def _build_param_schema(ui_elements):
+        """
+        Build the per-class parameter schema from UI element definitions.
+
+        Args:
+            ui_elements: List of UI element dictionaries
+
+        Returns:
+            List of (param_id, type, default, min, max, element) tuples
+        """
+        schema = []
+        for element in ui_elements:
+            param_id = element.get('id')
+            if not param_id:
+                continue
+            element_type = element.get('type', 'slider')
+            if element_type == 'checkbox':
+                default = element.get('default', False)
+            elif element_type in ('textfield', 'radio'):
+                default = element.get('default', '')
+            elif element_type == 'color':
+                default = element.get('default', '#000000')
+            else:  # slider or numeric
+                default = element.get('default', 0)
+            # An explicit 'min': None means unbounded, same as absent
+            lo = element.get('min')
+            hi = element.get('max')
+            lo = float('-inf') if lo is None else lo
+            hi = float('inf') if hi is None else hi
+            schema.append((param_id, element_type, default, lo, hi, element))
+        return schema
+
     def visible(self):
         """
         Whether this plugin should be visible in the plugin list.
@@ -90,13 +332,82 @@ class BaseCanvasPlugin:
         Returns:
             Storage key string
         """
-        # Use plugin class name to create unique keys
-        plugin_name = self.__class__.__name__
-        return f"canvasPlugin.{plugin_name}.{param_id}"
+        key = self._storage_keys.get(param_id)
+        if key is None:
+            # Parameter not declared in get_ui_elements() - build and cache
+            key = f"canvasPlugin.{self.__class__.__name__}.{param_id}"
+            self._storage_keys[param_id] = key
+        return key
     
+    def _load_parameters_blob(self):
+        """
+        Load the consolidated parameter blob from localStorage.
+
+        Returns:
+            Dict of stored parameter values, or None if missing/unreadable
+        """
+        global _storage_broken
+        if _localStorage is None or _storage_broken:
+            return None
+        try:
+            raw = _localStorage.getItem(self._blob_key)
+        except Exception:
+            _storage_broken = True
+            return None
+        if raw is not None:
+            try:
+                blob = json.loads(raw)
+            except ValueError:
+                return None
+            if isinstance(blob, dict):
+                return blob
+        return None
+
+    def _validate_stored_value(self, value, element_def):
+        """
+        Validate a value loaded from the parameter blob.
+
+        Args:
+            value: Decoded JSON value
+            element_def: UI element definition dict with min/max/default
+
+        Returns:
+            The value (clamped to min/max for numbers) or None if invalid
+        """
+        element_type = element_def.get('type', 'slider')
+
+        if element_type == 'checkbox':
+            return value if isinstance(value, bool) else None
+        elif element_type in ('textfield', 'radio', 'color'):
+            return value if isinstance(value, str) else None
+        else:  # slider or numeric
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            lo, hi = self._bounds.get(element_def.get('id'), _NO_BOUNDS)
+            return _clamp(float(value), lo, hi)
+
+    def _save_parameters_to_storage(self):
+        """
+        Serialize all parameters and write the blob in one setItem call.
+        """
+        global _storage_broken
+        if _localStorage is None or _storage_broken:
+            return
+        try:
+            payload = json.dumps(self._parameters)
+        except (TypeError, ValueError):
+            # An unserializable parameter value (e.g. a JsProxy) is a
+            # caller problem, not a storage failure - skip this save
+            # without disabling persistence for the session
+            return
+        try:
+            _localStorage.setItem(self._blob_key, payload)
+        except Exception:
+            _storage_broken = True
+
     def _load_parameter_from_storage(self, param_id, element_def):
         """
-        Load a parameter value from localStorage.
+        Load a parameter value from localStorage (legacy per-parameter key).
         
         Args:
             param_id: Parameter identifier
@@ -105,57 +416,61 @@ class BaseCanvasPlugin:
         Returns:
             Stored value (clamped to min/max for numbers) or None if not found
         """
+        global _storage_broken
+        if _localStorage is None or _storage_broken:
+            return None
         try:
-            import js
-            storage_key = self._get_storage_key(param_id)
-            stored_value = js.localStorage.getItem(storage_key)
-            
-            if stored_value is not None:
-                element_type = element_def.get('type', 'slider')
-                
-                # Handle different types
-                if element_type == 'checkbox':
-                    return stored_value.lower() == 'true'
-                elif element_type == 'textfield' or element_type == 'radio' or element_type == 'color':
-                    return stored_value
-                else:  # slider or numeric
-                    value = float(stored_value)
-                    
-                    # Clamp to valid range if min/max are defined
-                    min_val = element_def.get('min')
-                    max_val = element_def.get('max')
-                    
-                    if min_val is not None and value < min_val:
-                        value = min_val
-                    if max_val is not None and value > max_val:
-                        value = max_val
-                    
-                    return value
+            stored_value = _localStorage.getItem(self._get_storage_key(param_id))
         except Exception:
-            pass
-        
+            _storage_broken = True
+            return None
+
+        if stored_value is not None:
+            element_type = element_def.get('type', 'slider')
+
+            # Handle different types
+            if element_type == 'checkbox':
+                return stored_value.lower() == 'true'
+            elif element_type == 'textfield' or element_type == 'radio' or element_type == 'color':
+                return stored_value
+            else:  # slider or numeric
+                try:
+                    value = float(stored_value)
+                except ValueError:
+                    return None
+                lo, hi = self._bounds.get(param_id, _NO_BOUNDS)
+                return _clamp(value, lo, hi)
+
         return None
     
     def _save_parameter_to_storage(self, param_id, value):
         """
-        Save a parameter value to localStorage.
-        
+        Save a parameter value to localStorage (legacy per-parameter key).
+
+        New code should rely on the consolidated blob written by
+        _save_parameters_to_storage().
+
         Args:
             param_id: Parameter identifier
             value: Value to store
         """
+        global _storage_broken
+        if _localStorage is None or _storage_broken:
+            return
         try:
-            import js
-            storage_key = self._get_storage_key(param_id)
-            js.localStorage.setItem(storage_key, str(value))
+            _localStorage.setItem(self._get_storage_key(param_id), str(value))
         except Exception:
-            pass
+            _storage_broken = True
     
     def get_ui_elements(self):
         """
         Return a list of UI elements for this plugin.
         Override this in subclasses to define UI controls.
-        
+
+        The result is cached per class, so this should be a pure function
+        of the class. Set _ui_elements_cache_enabled = False on plugins
+        whose schema changes at runtime.
+
         Each element is a dictionary with:
         - type: 'slider', 'textfield', 'checkbox', 'radio', etc.
         - id: unique identifier for this element
@@ -228,19 +543,129 @@ class BaseCanvasPlugin:
         Returns:
             The current parameter value, or None if not found
         """
+        if not self._params_loaded:
+            self._ensure_parameters_loaded()
         return self._parameters.get(param_id)
     
     def set_parameter(self, param_id, value):
         """
-        Set a parameter value and automatically save to storage.
-        
+        Set a parameter value and schedule a save to storage.
+
+        Storage writes are batched: the parameter is marked dirty and all
+        dirty parameters are flushed in one pass on the next animation
+        frame. This keeps slider drags from crossing the Python-JS
+        boundary once per event.
+
         Args:
             param_id: The parameter identifier
             value: The new value (can be float, str, bool depending on UI element type)
         """
+        # Load first so the full-blob save below cannot clobber values of
+        # parameters that were never read this session
+        if not self._params_loaded:
+            self._ensure_parameters_loaded()
+        # Skip the write entirely when the value is unchanged - sliders and
+        # color pickers commonly re-fire the current value
+        if self._parameters.get(param_id, _MISSING) == value:
+            return
         self._parameters[param_id] = value
-        self._save_parameter_to_storage(param_id, value)
+        self._dirty.add(param_id)
+        self._dirty_draw = True
+        if not self._in_batch:
+            self._schedule_flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several set_parameter calls into one storage flush.
+
+        While the context is active, set_parameter only marks parameters
+        dirty; the consolidated blob is written once on exit. Use this
+        for linked controls that update multiple parameters per gesture.
+        """
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self._flush_storage()
+
+    def _schedule_flush(self):
+        """
+        Schedule a single storage flush on the next animation frame.
+
+        Falls back to an immediate synchronous save when running outside
+        the browser (e.g. in tests without Pyodide).
+        """
+        if self._flush_scheduled:
+            return
+        try:
+            from pyodide.ffi import create_proxy
+
+            if self._flush_proxy is None:
+                # Create the proxy once and reuse it to avoid proxy churn
+                self._flush_proxy = create_proxy(self._flush_storage)
+
+            self._flush_scheduled = True
+            _js.requestAnimationFrame(self._flush_proxy)
+        except Exception:
+            # No animation frame available - save directly. Reset the
+            # flag, otherwise a failed schedule would block every
+            # future flush for this instance
+            self._flush_scheduled = False
+            self._save_parameters_to_storage()
+            self._dirty.clear()
+
+    def _flush_storage(self, _timestamp=None):
+        """
+        Write the parameter blob to localStorage in one pass.
+
+        Args:
+            _timestamp: Animation frame timestamp (unused)
+        """
+        self._flush_scheduled = False
+        self._save_parameters_to_storage()
+        self._dirty.clear()
     
+    def _blit_cached_layer(self, ctx):
+        """
+        Blit the cached overlay bitmap if it is still valid.
+
+        Cacheable plugins call this at the top of draw_below/draw_above
+        and return early when it succeeds:
+
+            def draw_above(self, layer_data, glyph_name, ctx, viewport_manager):
+                if self._blit_cached_layer(ctx):
+                    return
+                ...render into an OffscreenCanvas...
+                self._store_cached_layer(offscreen)
+                ctx.drawImage(offscreen, 0, 0)
+
+        Args:
+            ctx: Canvas 2D rendering context
+
+        Returns:
+            True if the cached bitmap was drawn and rendering can be skipped
+        """
+        if not self.cacheable or self._dirty_draw or self._cached_layer is None:
+            return False
+        try:
+            ctx.drawImage(self._cached_layer, 0, 0)
+            return True
+        except Exception:
+            return False
+
+    def _store_cached_layer(self, canvas):
+        """
+        Store a rendered OffscreenCanvas for reuse on subsequent frames.
+
+        Args:
+            canvas: OffscreenCanvas holding the rendered overlay
+        """
+        self._cached_layer = canvas
+        self._dirty_draw = False
+
     def draw_below(self, layer_data, glyph_name, ctx, viewport_manager):
         """
         Draw below the glyph outline (first layer).
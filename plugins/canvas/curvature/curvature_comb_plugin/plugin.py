@@ -22,12 +22,168 @@ import math
 
 from base_canvas_plugin.plugin import BaseCanvasPlugin
 
+# NumPy vectorizes the per-curve sampling; fall back to scalar math when
+# it is not installed
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba compiles the batch curvature kernel to native code on desktop
+# CPython; Pyodide ships without it and uses the einsum path instead
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+def _curvature_arrays(ctrl, basis, dbasis, ddbasis, out):
+    """
+    Evaluate positions, perpendiculars and curvature for a quad batch.
+
+    Written as explicit loops so Numba can compile it; the inner j-loop
+    over the four control points is unrolled by the JIT. Results are
+    written into the preallocated (6, K, n) out buffer as
+    (x, y, perp_x, perp_y, kappa, valid).
+    """
+    num_quads = ctrl.shape[0]
+    n = basis.shape[0]
+    for k in range(num_quads):
+        for i in range(n):
+            x = 0.0
+            y = 0.0
+            dx = 0.0
+            dy = 0.0
+            ddx = 0.0
+            ddy = 0.0
+            for j in range(4):
+                cx = ctrl[k, j, 0]
+                cy = ctrl[k, j, 1]
+                x += basis[i, j] * cx
+                y += basis[i, j] * cy
+                dx += dbasis[i, j] * cx
+                dy += dbasis[i, j] * cy
+                ddx += ddbasis[i, j] * cx
+                ddy += ddbasis[i, j] * cy
+
+            speed_sq = dx * dx + dy * dy
+            if speed_sq < 1e-10:
+                kappa = 0.0
+                perp_x = 0.0
+                perp_y = 0.0
+                valid = 0.0
+            else:
+                speed = math.sqrt(speed_sq)
+                kappa = (dx * ddy - dy * ddx) / (speed_sq * speed)
+                if kappa > 1.0:
+                    kappa = 1.0
+                elif kappa < -1.0:
+                    kappa = -1.0
+                perp_x = -dy / speed
+                perp_y = dx / speed
+                valid = 1.0
+
+            out[0, k, i] = x
+            out[1, k, i] = y
+            out[2, k, i] = perp_x
+            out[3, k, i] = perp_y
+            out[4, k, i] = kappa
+            out[5, k, i] = valid
+    return out
+
+
+_curvature_kernel = None
+if _njit is not None and np is not None:
+    _curvature_kernel = _njit(cache=True, fastmath=True)(_curvature_arrays)
+
+# Cached Bernstein basis matrices keyed by sample count. The t-values
+# are fixed per sample count, so position/first/second-derivative bases
+# are built once and every curve evaluation becomes a matmul against
+# them.
+_basis_cache = {}
+
+
+def _get_bases(n):
+    """
+    Get (B, DB, DDB) basis matrices of shape (n, 4) for n samples.
+
+    B rows hold the Bernstein weights of the four control points at each
+    t; DB and DDB hold the weights of the first and second derivative
+    expressed directly in terms of the control points.
+    """
+    bases = _basis_cache.get(n)
+    if bases is None:
+        t = np.linspace(0.0, 1.0, n)
+        mt = 1.0 - t
+        t2 = t * t
+        mt2 = mt * mt
+
+        basis = np.stack(
+            [mt2 * mt, 3.0 * mt2 * t, 3.0 * mt * t2, t2 * t], axis=1
+        )
+        # B'(t) = 3(1-t)^2 (P1-P0) + 6(1-t)t (P2-P1) + 3t^2 (P3-P2)
+        d0 = 3.0 * mt2
+        d1 = 6.0 * mt * t
+        d2 = 3.0 * t2
+        dbasis = np.stack([-d0, d0 - d1, d1 - d2, d2], axis=1)
+        # B''(t) = 6(1-t)(P2 - 2P1 + P0) + 6t(P3 - 2P2 + P1)
+        e0 = 6.0 * mt
+        e1 = 6.0 * t
+        ddbasis = np.stack(
+            [e0, e1 - 2.0 * e0, e0 - 2.0 * e1, e1], axis=1
+        )
+        bases = (basis, dbasis, ddbasis)
+        _basis_cache[n] = bases
+    return bases
+
+
+# Scalar analogue of _basis_cache for the no-numpy fallback: per sample
+# count, a tuple of 12-tuples holding the position / first-derivative /
+# second-derivative Bernstein weights as plain floats. Evaluating a
+# curve then reduces to multiply-adds against constants instead of
+# recomputing t powers and calling the bezier helpers per sample.
+_scalar_coeff_cache = {}
+
+
+def _get_scalar_coeffs(n):
+    """
+    Get the per-sample Bernstein weight table for n samples.
+
+    Each entry is (b0..b3, db0..db3, e0..e3): the weights of the four
+    control points in the position, first and second derivative at one
+    t value.
+    """
+    coeffs = _scalar_coeff_cache.get(n)
+    if coeffs is None:
+        rows = []
+        last = n - 1
+        for i in range(n):
+            t = i / last if last else 0.0
+            mt = 1.0 - t
+            t2 = t * t
+            mt2 = mt * mt
+            d0 = 3.0 * mt2
+            d1 = 6.0 * mt * t
+            d2 = 3.0 * t2
+            e0 = 6.0 * mt
+            e1 = 6.0 * t
+            rows.append((
+                mt2 * mt, 3.0 * mt2 * t, 3.0 * mt * t2, t2 * t,
+                -d0, d0 - d1, d1 - d2, d2,
+                e0, e1 - 2.0 * e0, e0 - 2.0 * e1, e1,
+            ))
+        coeffs = tuple(rows)
+        _scalar_coeff_cache[n] = coeffs
+    return coeffs
+
 # Import JavaScript console for logging
 try:
     import js
     console = js.console
 except ImportError:
     # Fallback for testing outside of Pyodide
+    js = None
+
     class FakeConsole:
         def log(self, *args):
             print(*args)
@@ -44,10 +200,17 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
     
     name = "Curvature Comb"
     version = "0.1.0"
-    
+
+    # The draw methods only touch their arguments (layer_data, ctx,
+    # viewport_manager), so a host may render this plugin in a worker
+    # with an OffscreenCanvas to keep sampling off the main thread
+    worker_safe = True
+
     # Configuration
-    SAMPLES_PER_CURVE = 50  # Number of teeth per curve segment
+    SAMPLES_PER_CURVE = 50  # Maximum teeth per curve segment
+    MIN_SAMPLES_PER_CURVE = 8  # Floor for nearly-straight segments
     OPACITY = 0.4           # Opacity of comb teeth
+    NUM_COLOR_BUCKETS = 16  # Color quantization for batched fills
     DEBUG = False           # Enable debug logging
     
     def visible(self):
@@ -105,107 +268,385 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
             return
         
         ctx.save()
-        
+
+        # Only draw curves whose control hull can intersect the view
+        visible_rect = self._visible_rect(ctx)
+
         # Process each shape (path) independently with its own min/max
         total_curve_count = 0
         for i, shape in enumerate(shapes):
             if 'Path' in shape:
-                # Collect curvature data for this path only
-                curve_data_list = self._collect_curve_data(shape)
-                
+                # Curve data is viewport-independent and cached across
+                # repaints; pan/zoom only re-runs the draw stage
+                curve_data_list, min_curvature, max_curvature = \
+                    self._collect_curve_data_cached(shape)
+
                 if not curve_data_list:
                     continue
-                
-                # Find min/max curvature for this path
-                path_curvatures = []
-                for curve_data in curve_data_list:
-                    path_curvatures.extend([abs_cv for _, _, _, abs_cv in curve_data['samples']])
-                
-                if not path_curvatures:
-                    continue
-                
-                min_curvature = min(path_curvatures)
-                max_curvature = max(path_curvatures)
-                
+
                 if self.DEBUG:
                     console.log(f"[CurvatureComb] Path {i} curvature range: {min_curvature} to {max_curvature}")
-                
+
                 # Draw this path's curves with its own color range
-                for curve_data in curve_data_list:
-                    self._draw_curve_data(curve_data, ctx, min_curvature, max_curvature)
-                    total_curve_count += 1
-        
+                total_curve_count += self._draw_curve_list(
+                    curve_data_list, ctx, min_curvature, max_curvature,
+                    visible_rect
+                )
+
         ctx.restore()
     
+    def _visible_rect(self, ctx):
+        """
+        Compute the visible rect in the local drawing space.
+
+        The host calls plugins with the full canvas transform already
+        applied - the DPR scale, the viewport matrix and the selected
+        glyph's translate within the text run - so the rect is derived
+        by inverting the live matrix from ctx.getTransform().
+        Rebuilding the viewport matrix alone would displace the rect by
+        the glyph offset for any selected glyph past the first and cull
+        fully on-screen segments.
+
+        Args:
+            ctx: Canvas 2D rendering context
+
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y) or None if unavailable
+        """
+        try:
+            m = ctx.getTransform()
+            a, b, c, d, e, f = m.a, m.b, m.c, m.d, m.e, m.f
+            det = a * d - b * c
+            if not det:
+                return None
+            width = ctx.canvas.width
+            height = ctx.canvas.height
+            # Map the canvas corners through the inverse matrix; the
+            # min/max bound stays correct under rotated component
+            # transforms too
+            xs = []
+            ys = []
+            for px, py in ((0, 0), (width, 0), (0, height),
+                           (width, height)):
+                dx = px - e
+                dy = py - f
+                xs.append((dx * d - dy * c) / det)
+                ys.append((dy * a - dx * b) / det)
+            return (min(xs), min(ys), max(xs), max(ys))
+        except Exception:
+            return None
+
+    def _collect_curve_data_cached(self, shape, _max_entries=64):
+        """
+        Cached wrapper around _collect_curve_data.
+
+        draw_below runs on every repaint, but the sampled curve data
+        only depends on the node coordinates. Results (including the
+        per-path curvature range) are cached keyed by a hash of the node
+        content, so pan/zoom/hover repaints skip the whole sampling
+        pipeline. The cache holds the most recent _max_entries paths.
+
+        Args:
+            shape: Shape dictionary with Path data
+
+        Returns:
+            Tuple (curve_data_list, min_curvature, max_curvature)
+        """
+        nodes = shape.get('nodes', [])
+        if not nodes and 'Path' in shape:
+            nodes = shape['Path'].get('nodes', [])
+
+        try:
+            key = hash(tuple(
+                (n.get('nodetype'), n.get('x'), n.get('y'))
+                for n in nodes if isinstance(n, dict)
+            ))
+        except TypeError:
+            # Unhashable node content - sample without caching
+            return self._curve_range(self._collect_curve_data(shape))
+
+        cache = getattr(self, '_curve_cache', None)
+        if cache is None:
+            cache = self._curve_cache = {}
+
+        entry = cache.get(key)
+        if entry is None:
+            entry = self._curve_range(self._collect_curve_data(shape))
+            if len(cache) >= _max_entries:
+                # Evict the least recently used entry (insertion order)
+                cache.pop(next(iter(cache)))
+            cache[key] = entry
+        else:
+            # Refresh LRU position
+            cache.pop(key)
+            cache[key] = entry
+        return entry
+
+    @staticmethod
+    def _curve_range(curve_data_list):
+        """
+        Compute the curvature range of a path's curve data.
+
+        Args:
+            curve_data_list: List of curve data dictionaries
+
+        Returns:
+            Tuple (curve_data_list, min_curvature, max_curvature)
+        """
+        min_curvature = float('inf')
+        max_curvature = float('-inf')
+        for curve_data in curve_data_list:
+            # Per-curve extremes were tracked during sampling
+            lo = curve_data['min_k']
+            hi = curve_data['max_k']
+            if lo < min_curvature:
+                min_curvature = lo
+            if hi > max_curvature:
+                max_curvature = hi
+        if min_curvature > max_curvature:
+            return ([], 0.0, 0.0)
+        return (curve_data_list, min_curvature, max_curvature)
+
     def _collect_curve_data(self, shape):
         """
         Collect curvature data for all cubic bezier curves in a path without drawing.
-        
+
+        The result is viewport-independent (and therefore cacheable);
+        each curve carries its control-hull bbox so the draw stage can
+        cull off-screen curves.
+
         Args:
             shape: Shape dictionary with Path data
-            
+
         Returns:
             List of curve data dictionaries
         """
-        curve_data_list = []
         nodes = shape.get('nodes', [])
         if not nodes and 'Path' in shape:
             nodes = shape['Path'].get('nodes', [])
-        
+
         if not nodes or len(nodes) < 2:
-            return curve_data_list
-        
+            return []
+
+        # Preconvert nodes once into (type, x, y) tuples - malformed
+        # nodes become None - so the detection loop below does tuple
+        # indexing instead of repeated dict lookups and float() casts
+        typed = []
+        for n in nodes:
+            if isinstance(n, dict):
+                try:
+                    typed.append(
+                        (n.get('nodetype', 'l'), float(n['x']), float(n['y']))
+                    )
+                    continue
+                except (KeyError, TypeError, ValueError):
+                    pass
+            typed.append(None)
+
+        # Resolve wraparound once: closed paths get the first three
+        # nodes appended so the lookahead can index directly, instead of
+        # three modulo operations per iteration
+        if isinstance(shape.get('Path'), dict):
+            closed = shape['Path'].get('closed', True)
+        else:
+            closed = shape.get('closed', True)
+        if closed:
+            # Cycle the padding so paths shorter than three nodes still
+            # get three full wraparound entries
+            lookahead = typed + (typed * 2)[:3]
+            max_iterations = len(typed)
+        else:
+            lookahead = typed
+            max_iterations = len(typed) - 3
+
+        # First pass: detect cubic segments and gather control quads
+        quads = []
         i = 0
-        max_iterations = len(nodes)
         while i < max_iterations:
-            try:
-                node = nodes[i]
-                if not isinstance(node, dict):
-                    i += 1
-                    continue
-                    
-                node_type = node.get('nodetype', 'l')
-                
-                # Look ahead for cubic bezier curves
-                next1 = nodes[(i + 1) % len(nodes)]
-                next2 = nodes[(i + 2) % len(nodes)]
-                next3 = nodes[(i + 3) % len(nodes)]
-                
-                if not all(isinstance(n, dict) for n in [next1, next2, next3]):
-                    i += 1
-                    continue
-                
-                # Check if this is a cubic bezier
-                if (node_type in ('c', 'cs', 'l', 'ls') and 
-                    next1.get('nodetype') == 'o' and 
-                    next2.get('nodetype') == 'o' and 
-                    next3.get('nodetype') in ('c', 'cs', 'l', 'ls')):
-                    
-                    if not all('x' in n and 'y' in n for n in [node, next1, next2, next3]):
-                        i += 1
-                        continue
-                    
-                    p0 = (float(node['x']), float(node['y']))
-                    p1 = (float(next1['x']), float(next1['y']))
-                    p2 = (float(next2['x']), float(next2['y']))
-                    p3 = (float(next3['x']), float(next3['y']))
-                    
-                    # Collect sample data for this curve
-                    curve_data = self._sample_cubic_curve(p0, p1, p2, p3)
-                    if curve_data:
-                        curve_data_list.append(curve_data)
-                    
+            node = lookahead[i]
+            if node is None:
+                i += 1
+                continue
+
+            # Look ahead for cubic bezier curves
+            next1 = lookahead[i + 1]
+            next2 = lookahead[i + 2]
+            next3 = lookahead[i + 3]
+
+            if next1 is None or next2 is None or next3 is None:
+                i += 1
+                continue
+
+            # Check if this is a cubic bezier
+            if (node[0] in ('c', 'cs', 'l', 'ls') and
+                    next1[0] == 'o' and
+                    next2[0] == 'o' and
+                    next3[0] in ('c', 'cs', 'l', 'ls')):
+
+                _, p0x, p0y = node
+                _, p1x, p1y = next1
+                _, p2x, p2y = next2
+                _, p3x, p3y = next3
+
+                # Colinear control points mean identically zero
+                # curvature - the teeth would be invisible, so skip
+                # the whole sampling for this "line as cubic"
+                cx = p3x - p0x
+                cy = p3y - p0y
+                cross1 = (p1x - p0x) * cy - (p1y - p0y) * cx
+                cross2 = (p2x - p0x) * cy - (p2y - p0y) * cx
+                eps = 1e-6 * (cx * cx + cy * cy)
+                if abs(cross1) <= eps and abs(cross2) <= eps:
                     i += 3
                     continue
-            except Exception as e:
-                if self.DEBUG:
-                    console.log(f"[CurvatureComb] Error collecting data at node {i}: {e}")
-                i += 1
+
+                quads.append((
+                    (p0x, p0y), (p1x, p1y), (p2x, p2y), (p3x, p3y),
+                ))
+
+                i += 3
                 continue
-            
+
             i += 1
-        
+
+        if not quads:
+            return []
+
+        # Second pass: sample all quads, in one tensor evaluation when
+        # NumPy is available
+        if np is not None:
+            results = self._sample_cubic_batch(quads)
+        else:
+            results = []
+            for p0, p1, p2, p3 in quads:
+                n = self._sample_count_for(p0, p1, p2, p3)
+                results.append(self._sample_cubic_curve(p0, p1, p2, p3, n))
+
+        # Attach control-hull bboxes for draw-time culling
+        curve_data_list = []
+        for quad, curve_data in zip(quads, results):
+            if curve_data is None:
+                continue
+            xs = (quad[0][0], quad[1][0], quad[2][0], quad[3][0])
+            ys = (quad[0][1], quad[1][1], quad[2][1], quad[3][1])
+            curve_data['bbox'] = (min(xs), min(ys), max(xs), max(ys))
+            curve_data_list.append(curve_data)
         return curve_data_list
+
+    def _sample_count_for(self, p0, p1, p2, p3):
+        """
+        Choose a sample count from the curve's flatness.
+
+        Nearly-straight cubics (the dominant case in Latin outlines) get
+        MIN_SAMPLES_PER_CURVE teeth; strongly curved segments scale up
+        to SAMPLES_PER_CURVE. Flatness is estimated from the control
+        points' perpendicular deviation off the p0-p3 chord.
+
+        Args:
+            p0, p1, p2, p3: Bezier control points
+
+        Returns:
+            Number of samples to take for this curve
+        """
+        cx = p3[0] - p0[0]
+        cy = p3[1] - p0[1]
+        chord = math.hypot(cx, cy)
+        if chord < 1e-9:
+            return self.SAMPLES_PER_CURVE
+
+        d1 = abs((p1[0] - p0[0]) * cy - (p1[1] - p0[1]) * cx)
+        d2 = abs((p2[0] - p0[0]) * cy - (p2[1] - p0[1]) * cx)
+        deviation = (d1 + d2) / chord
+
+        n = self.MIN_SAMPLES_PER_CURVE + int(2.0 * math.sqrt(deviation))
+        if n > self.SAMPLES_PER_CURVE:
+            return self.SAMPLES_PER_CURVE
+        return n
+
+    def _sample_cubic_batch(self, quads):
+        """
+        Sample all cubic segments of a path in one NumPy evaluation.
+
+        Stacks the K control quads into a (K,4,2) tensor and evaluates
+        positions, derivatives and curvature for all K*n samples at
+        once, amortizing array-dispatch overhead across the whole path.
+
+        Args:
+            quads: List of (p0, p1, p2, p3) control point tuples
+
+        Returns:
+            List aligned with quads; None entries for degenerate curves
+        """
+        # Group quads by their adaptive sample count so each group can
+        # be evaluated against one basis, preserving path order
+        groups = {}
+        for idx, quad in enumerate(quads):
+            n = self._sample_count_for(*quad)
+            groups.setdefault(n, []).append(idx)
+
+        results = [None] * len(quads)
+        for n, indices in groups.items():
+            self._sample_cubic_group(
+                [quads[i] for i in indices], indices, n, results
+            )
+        return results
+
+    def _sample_cubic_group(self, quads, indices, n, results):
+        """
+        Evaluate one same-sample-count group of quads in a tensor pass.
+
+        Args:
+            quads: Control quads sharing the sample count
+            indices: Original positions of the quads in the path
+            n: Sample count for this group
+            results: Output list, filled at the original positions
+        """
+        basis, dbasis, ddbasis = _get_bases(n)
+        ctrl = np.array(quads, dtype=np.float64)        # (K,4,2)
+
+        if _curvature_kernel is not None:
+            out = np.empty((6, len(quads), n))
+            _curvature_kernel(ctrl, basis, dbasis, ddbasis, out)
+            x, y, perp_x, perp_y, kappa = out[:5]
+            valid = (out[5] > 0.5) & np.isfinite(x) & np.isfinite(y)
+        else:
+            pts = np.einsum('nj,kjd->knd', basis, ctrl)     # (K,n,2)
+            d1 = np.einsum('nj,kjd->knd', dbasis, ctrl)
+            d2 = np.einsum('nj,kjd->knd', ddbasis, ctrl)
+
+            x = pts[..., 0]
+            y = pts[..., 1]
+            dx = d1[..., 0]
+            dy = d1[..., 1]
+            ddx = d2[..., 0]
+            ddy = d2[..., 1]
+
+            speed_sq = dx * dx + dy * dy
+            speed = np.sqrt(speed_sq)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                kappa = np.where(
+                    speed_sq < 1e-10,
+                    0.0,
+                    (dx * ddy - dy * ddx) / (speed_sq * speed),
+                )
+                perp_x = np.where(speed < 1e-10, 0.0, -dy / speed)
+                perp_y = np.where(speed < 1e-10, 0.0, dx / speed)
+            np.clip(kappa, -1.0, 1.0, out=kappa)
+
+            valid = (speed >= 1e-10) & np.isfinite(x) & np.isfinite(y)
+
+        for k in range(len(quads)):
+            vk = valid[k]
+            if vk.sum() < 2:
+                continue
+            kk = kappa[k][vk]
+            absk = np.abs(kk)
+            results[indices[k]] = {
+                'px': x[k][vk], 'py': y[k][vk],
+                'perpx': perp_x[k][vk], 'perpy': perp_y[k][vk],
+                'k': -kk, 'absk': absk,
+                'min_k': absk.min(), 'max_k': absk.max(),
+            }
     
     def _draw_path_curvature(self, shape, ctx):
         """
@@ -298,53 +739,324 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
         
         return curve_count
     
-    def _sample_cubic_curve(self, p0, p1, p2, p3):
+    def _sample_cubic_curve(self, p0, p1, p2, p3, n=None):
         """
         Sample a cubic bezier curve to collect curvature data.
-        
+
         Args:
             p0, p1, p2, p3: Bezier control points
-            
+            n: Number of samples (defaults to SAMPLES_PER_CURVE)
+
         Returns:
             Dictionary with curve data or None
         """
-        try:
-            samples = []
-            
-            for i in range(self.SAMPLES_PER_CURVE):
-                try:
-                    t = i / (self.SAMPLES_PER_CURVE - 1) if self.SAMPLES_PER_CURVE > 1 else 0
-                    
-                    point = self._cubic_bezier_point(p0, p1, p2, p3, t)
-                    curvature = self._cubic_bezier_curvature(p0, p1, p2, p3, t)
-                    tangent = self._cubic_bezier_tangent(p0, p1, p2, p3, t)
-                    
-                    if tangent[0] == 0 and tangent[1] == 0:
+        if n is None:
+            n = self.SAMPLES_PER_CURVE
+        if np is not None:
+            return self._sample_cubic_curve_numpy(p0, p1, p2, p3, n)
+
+        # Validate inputs once; the loop arithmetic cannot raise for
+        # finite control points, so no per-sample exception guard needed
+        for p in (p0, p1, p2, p3):
+            if not (math.isfinite(p[0]) and math.isfinite(p[1])):
+                return None
+
+        # Parallel per-field arrays (SoA) instead of tuples of tuples;
+        # the curvature range is tracked while sampling so no second
+        # pass is needed downstream
+        px = []
+        py = []
+        perpx = []
+        perpy = []
+        k_signed = []
+        k_abs = []
+        min_k = float('inf')
+        max_k = float('-inf')
+
+        # Evaluate against the precomputed weight table: straight
+        # multiply-adds per sample, no per-sample t powers or calls
+        # into the bezier helpers
+        p0x, p0y = p0
+        p1x, p1y = p1
+        p2x, p2y = p2
+        p3x, p3y = p3
+        sqrt = math.sqrt
+        for b0, b1, b2, b3, db0, db1, db2, db3, e0, e1, e2, e3 in (
+            _get_scalar_coeffs(n)
+        ):
+            dx = db0 * p0x + db1 * p1x + db2 * p2x + db3 * p3x
+            dy = db0 * p0y + db1 * p1y + db2 * p2y + db3 * p3y
+            speed_sq = dx * dx + dy * dy
+            speed = sqrt(speed_sq)
+            if speed < 1e-10:
+                continue
+
+            if speed_sq < 1e-10:
+                curvature = 0.0
+            else:
+                ddx = e0 * p0x + e1 * p1x + e2 * p2x + e3 * p3x
+                ddy = e0 * p0y + e1 * p1y + e2 * p2y + e3 * p3y
+                curvature = (dx * ddy - dy * ddx) / (speed_sq * speed)
+                if curvature > 1.0:
+                    curvature = 1.0
+                elif curvature < -1.0:
+                    curvature = -1.0
+
+            px.append(b0 * p0x + b1 * p1x + b2 * p2x + b3 * p3x)
+            py.append(b0 * p0y + b1 * p1y + b2 * p2y + b3 * p3y)
+            perpx.append(-dy / speed)
+            perpy.append(dx / speed)
+            k_signed.append(-curvature)
+            abs_k = abs(curvature)
+            k_abs.append(abs_k)
+            if abs_k < min_k:
+                min_k = abs_k
+            if abs_k > max_k:
+                max_k = abs_k
+
+        if len(px) >= 2:
+            return {
+                'px': px, 'py': py,
+                'perpx': perpx, 'perpy': perpy,
+                'k': k_signed, 'absk': k_abs,
+                'min_k': min_k, 'max_k': max_k,
+            }
+        return None
+    
+    def _sample_cubic_curve_numpy(self, p0, p1, p2, p3, n=None):
+        """
+        Vectorized curve sampling: evaluate all t-values in one pass.
+
+        Computes points, tangents and curvatures as NumPy array
+        expressions instead of per-sample scalar round trips.
+
+        Args:
+            p0, p1, p2, p3: Bezier control points
+            n: Number of samples (defaults to SAMPLES_PER_CURVE)
+
+        Returns:
+            Dictionary with curve data or None
+        """
+        basis, dbasis, ddbasis = _get_bases(n or self.SAMPLES_PER_CURVE)
+
+        # One (n,4) @ (4,2) matmul per quantity
+        ctrl = np.array([p0, p1, p2, p3], dtype=np.float64)
+        x, y = (basis @ ctrl).T
+        dx, dy = (dbasis @ ctrl).T
+        ddx, ddy = (ddbasis @ ctrl).T
+
+        speed_sq = dx * dx + dy * dy
+        speed = np.sqrt(speed_sq)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            kappa = np.where(
+                speed_sq < 1e-10,
+                0.0,
+                (dx * ddy - dy * ddx) / (speed_sq * speed),
+            )
+            perp_x = np.where(speed < 1e-10, 0.0, -dy / speed)
+            perp_y = np.where(speed < 1e-10, 0.0, dx / speed)
+        np.clip(kappa, -1.0, 1.0, out=kappa)
+
+        valid = (speed >= 1e-10) & np.isfinite(x) & np.isfinite(y)
+        if valid.sum() < 2:
+            return None
+        kv = kappa[valid]
+        absk = np.abs(kv)
+        return {
+            'px': x[valid], 'py': y[valid],
+            'perpx': perp_x[valid], 'perpy': perp_y[valid],
+            'k': -kv, 'absk': absk,
+            'min_k': absk.min(), 'max_k': absk.max(),
+        }
+
+    def _draw_curve_list(self, curve_data_list, ctx, min_curvature,
+                         max_curvature, visible_rect=None):
+        """
+        Draw all curves of a path with fills batched per color bucket.
+
+        The gradient is quantized into NUM_COLOR_BUCKETS bins; every
+        tooth quad is accumulated into one shared Path2D per bin and
+        each bin is filled with a single ctx.fill call. This collapses
+        the per-segment beginPath/fill round trips into at most
+        NUM_COLOR_BUCKETS draw calls per path. Curves whose control-hull
+        bbox lies outside visible_rect are skipped.
+
+        Args:
+            curve_data_list: List of curve data dictionaries
+            ctx: Canvas 2D rendering context
+            min_curvature: Minimum curvature in path
+            max_curvature: Maximum curvature in path
+            visible_rect: Optional (min_x, min_y, max_x, max_y) in font
+                space for culling
+
+        Returns:
+            Number of curves drawn
+        """
+        if visible_rect is not None:
+            vx0, vy0, vx1, vy1 = visible_rect
+            curve_data_list = [
+                c for c in curve_data_list
+                if 'bbox' not in c or not (
+                    c['bbox'][2] < vx0 or c['bbox'][0] > vx1 or
+                    c['bbox'][3] < vy0 or c['bbox'][1] > vy1
+                )
+            ]
+
+        if js is None:
+            # No Path2D available - draw each curve directly
+            for curve_data in curve_data_list:
+                self._draw_curve_data(curve_data, ctx, min_curvature, max_curvature)
+            return len(curve_data_list)
+
+        num_buckets = self.NUM_COLOR_BUCKETS
+        scale_factor = self.SCALE_FACTOR
+        exponent = self.get_parameter('exponent')
+        curv_range = max_curvature - min_curvature
+        inv_range = 1.0 / curv_range if curv_range >= 1e-10 else 0.0
+        buckets = [None] * num_buckets
+
+        for curve_data in curve_data_list:
+            px = curve_data['px']
+            py = curve_data['py']
+            perpx = curve_data['perpx']
+            perpy = curve_data['perpy']
+            k_signed = curve_data['k']
+            k_abs = curve_data['absk']
+
+            # With numpy-backed samples, tooth lengths and bucket
+            # indices for the whole curve come from a handful of array
+            # expressions instead of per-segment Python arithmetic
+            use_np = np is not None and hasattr(k_abs, 'dtype')
+            if use_np:
+                tooth = k_signed * scale_factor
+                seg_ok = (
+                    (np.abs(tooth[:-1]) <= 10000)
+                    & (np.abs(tooth[1:]) <= 10000)
+                )
+                t_seg = (k_abs[:-1] + k_abs[1:]) * 0.5 - min_curvature
+                t_seg *= inv_range
+                np.clip(t_seg, 0.0, 1.0, out=t_seg)
+                bucket_indices = (
+                    t_seg ** exponent * (num_buckets - 1)
+                ).astype(np.intp)
+
+            for i in range(len(px) - 1):
+                if use_np:
+                    if not seg_ok[i]:
                         continue
-                    
-                    tangent_length = math.sqrt(tangent[0]**2 + tangent[1]**2)
-                    if tangent_length < 1e-10:
+                    tooth_length_i = tooth[i]
+                    tooth_length_next = tooth[i + 1]
+                    bucket_idx = bucket_indices[i]
+                else:
+                    tooth_length_i = k_signed[i] * scale_factor
+                    tooth_length_next = k_signed[i + 1] * scale_factor
+
+                    # Skip extreme values
+                    if (abs(tooth_length_i) > 10000
+                            or abs(tooth_length_next) > 10000):
                         continue
-                    
-                    tangent_norm = (tangent[0] / tangent_length, tangent[1] / tangent_length)
-                    perp = (-tangent_norm[1], tangent_norm[0])
-                    
-                    if math.isfinite(point[0]) and math.isfinite(point[1]):
-                        # Store: point, perpendicular direction, raw curvature value
-                        samples.append((point, perp, -curvature, abs(curvature)))
-                except Exception as e:
-                    if self.DEBUG:
-                        console.log(f"[CurvatureComb] Error sampling: {e}")
-                    continue
-            
-            if len(samples) >= 2:
-                return {'samples': samples}
-            return None
-        except Exception as e:
-            if self.DEBUG:
-                console.log(f"[CurvatureComb] Error in sampling: {e}")
-            return None
-    
+
+                    # Bucket by segment-average curvature, post-exponent
+                    t = (k_abs[i] + k_abs[i + 1]) / 2 - min_curvature
+                    t = t * inv_range
+                    t = max(0.0, min(1.0, t)) ** exponent
+                    bucket_idx = int(t * (num_buckets - 1))
+
+                parts = buckets[bucket_idx]
+                if parts is None:
+                    parts = []
+                    buckets[bucket_idx] = parts
+
+                # Accumulate the quad as SVG path data; the whole bucket
+                # becomes a single Path2D construction instead of five
+                # boundary-crossing path calls per segment
+                x0 = px[i]
+                y0 = py[i]
+                x1 = px[i + 1]
+                y1 = py[i + 1]
+                tx0 = x0 + perpx[i] * tooth_length_i
+                ty0 = y0 + perpy[i] * tooth_length_i
+                tx1 = x1 + perpx[i + 1] * tooth_length_next
+                ty1 = y1 + perpy[i + 1] * tooth_length_next
+
+                # On straight-ish runs the quad degenerates to an
+                # axis-aligned rectangle (within the .2f formatting
+                # precision); emit the H/V shorthand there - 5 numbers
+                # for the path parser instead of 8
+                if (abs(y0 - y1) < 0.005 and abs(ty0 - ty1) < 0.005
+                        and abs(tx0 - x0) < 0.005
+                        and abs(tx1 - x1) < 0.005):
+                    parts.append(
+                        f'M{x0:.2f} {y0:.2f}H{x1:.2f}V{ty1:.2f}'
+                        f'H{x0:.2f}Z'
+                    )
+                elif (abs(x0 - x1) < 0.005 and abs(tx0 - tx1) < 0.005
+                        and abs(ty0 - y0) < 0.005
+                        and abs(ty1 - y1) < 0.005):
+                    parts.append(
+                        f'M{x0:.2f} {y0:.2f}V{y1:.2f}H{tx1:.2f}'
+                        f'V{y0:.2f}Z'
+                    )
+                else:
+                    parts.append(
+                        f'M{x0:.2f} {y0:.2f}'
+                        f'L{x1:.2f} {y1:.2f}'
+                        f'L{tx1:.2f} {ty1:.2f}'
+                        f'L{tx0:.2f} {ty0:.2f}Z'
+                    )
+
+        colors = self._bucket_colors()
+        for bucket_idx, parts in enumerate(buckets):
+            if parts is not None:
+                ctx.fillStyle = colors[bucket_idx]
+                ctx.fill(js.Path2D.new(''.join(parts)))
+
+        return len(curve_data_list)
+
+    def _bucket_colors(self):
+        """
+        Get the per-bucket rgba strings, built once per class.
+
+        The bucket colors depend only on NUM_COLOR_BUCKETS and OPACITY,
+        so the strings are cached at class level instead of being
+        re-formatted on every draw.
+
+        Returns:
+            List of NUM_COLOR_BUCKETS CSS color strings
+        """
+        cls = type(self)
+        colors = cls.__dict__.get('_bucket_color_cache')
+        if colors is None:
+            colors = [
+                self._blend_color((i + 0.5) / self.NUM_COLOR_BUCKETS)
+                for i in range(self.NUM_COLOR_BUCKETS)
+            ]
+            cls._bucket_color_cache = colors
+        return colors
+
+    def _blend_color(self, t):
+        """
+        Map a normalized (post-exponent) value to the gradient color.
+
+        Args:
+            t: Value in [0, 1]
+
+        Returns:
+            CSS color string with opacity from setting
+        """
+        # Color gradient: gray (128,128,128) -> yellow (255,255,0) -> red (255,0,0)
+        if t < 0.5:
+            blend = t * 2
+            r = int(128 + 127 * blend)
+            g = int(128 + 127 * blend)
+            b = int(128 - 128 * blend)
+        else:
+            blend = (t - 0.5) * 2
+            r = 255
+            g = int(255 - 255 * blend)
+            b = 0
+        return f'rgba({r}, {g}, {b}, {self.OPACITY})'
+
     def _draw_curve_data(self, curve_data, ctx, min_curvature, max_curvature):
         """
         Draw curvature comb with color mapping based on curvature range.
@@ -356,50 +1068,51 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
             max_curvature: Maximum curvature in glyph
         """
         try:
-            samples = curve_data['samples']
-            
-            for i in range(len(samples) - 1):
+            px = curve_data['px']
+            py = curve_data['py']
+            perpx = curve_data['perpx']
+            perpy = curve_data['perpy']
+            k_signed = curve_data['k']
+            k_abs = curve_data['absk']
+
+            # Read parameters once per curve, not once per segment - the
+            # SCALE_FACTOR property and exponent each go through
+            # get_parameter
+            scale_factor = self.SCALE_FACTOR
+            exponent = self.get_parameter('exponent')
+            curv_range = max_curvature - min_curvature
+
+            for i in range(len(px) - 1):
                 try:
-                    point_i, perp_i, signed_curv_i, abs_curv_i = samples[i]
-                    point_next, perp_next, signed_curv_next, abs_curv_next = samples[i + 1]
-                    
-                    # Calculate average curvature for this segment
-                    avg_curvature = (abs_curv_i + abs_curv_next) / 2
-                    
-                    # Normalize curvature to 0-1 range
-                    if max_curvature - min_curvature < 1e-10:
-                        t_i = 0
-                        t_next = 0
-                    else:
-                        t_i = (abs_curv_i - min_curvature) / (max_curvature - min_curvature)
-                        t_next = (abs_curv_next - min_curvature) / (max_curvature - min_curvature)
-                    
-                    # Clamp to 0-1
-                    t_i = max(0, min(1, t_i))
-                    t_next = max(0, min(1, t_next))
-                    
                     # Use raw curvature for tooth length (no exponent applied)
-                    # Use signed curvature direction with original magnitude
-                    tooth_length_i = (signed_curv_i / abs_curv_i if abs_curv_i > 0 else 0) * abs_curv_i * self.SCALE_FACTOR
-                    tooth_length_next = (signed_curv_next / abs_curv_next if abs_curv_next > 0 else 0) * abs_curv_next * self.SCALE_FACTOR
-                    
+                    tooth_length_i = k_signed[i] * scale_factor
+                    tooth_length_next = k_signed[i + 1] * scale_factor
+
                     # Skip extreme values
                     if abs(tooth_length_i) > 10000 or abs(tooth_length_next) > 10000:
                         continue
-                    
-                    # Calculate tooth endpoints
-                    tooth_end_i = (point_i[0] + perp_i[0] * tooth_length_i, point_i[1] + perp_i[1] * tooth_length_i)
-                    tooth_end_next = (point_next[0] + perp_next[0] * tooth_length_next, point_next[1] + perp_next[1] * tooth_length_next)
-                    
-                    # Map curvature to color: gray → yellow → red
-                    color = self._get_curvature_color(avg_curvature, min_curvature, max_curvature)
-                    
-                    ctx.fillStyle = color
+
+                    # Map segment-average curvature to color:
+                    # gray → yellow → red
+                    if curv_range < 1e-10:
+                        t_color = 0.0
+                    else:
+                        avg_curvature = (k_abs[i] + k_abs[i + 1]) / 2
+                        t_color = (avg_curvature - min_curvature) / curv_range
+                    t_color = max(0.0, min(1.0, t_color)) ** exponent
+
+                    ctx.fillStyle = self._blend_color(t_color)
                     ctx.beginPath()
-                    ctx.moveTo(point_i[0], point_i[1])
-                    ctx.lineTo(point_next[0], point_next[1])
-                    ctx.lineTo(tooth_end_next[0], tooth_end_next[1])
-                    ctx.lineTo(tooth_end_i[0], tooth_end_i[1])
+                    ctx.moveTo(px[i], py[i])
+                    ctx.lineTo(px[i + 1], py[i + 1])
+                    ctx.lineTo(
+                        px[i + 1] + perpx[i + 1] * tooth_length_next,
+                        py[i + 1] + perpy[i + 1] * tooth_length_next,
+                    )
+                    ctx.lineTo(
+                        px[i] + perpx[i] * tooth_length_i,
+                        py[i] + perpy[i] * tooth_length_i,
+                    )
                     ctx.closePath()
                     ctx.fill()
                 except Exception as e:
@@ -457,7 +1170,7 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
         curve_data = self._sample_cubic_curve(p0, p1, p2, p3)
         if curve_data:
             self._draw_curve_data(curve_data, ctx, 0, 1)
-            return len(curve_data['samples']) - 1
+            return len(curve_data['px']) - 1
         return 0
     
     def _cubic_bezier_point(self, p0, p1, p2, p3, t):
@@ -471,21 +1184,18 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
         Returns:
             Point (x, y) on curve
         """
-        try:
-            # B(t) = (1-t)³P₀ + 3(1-t)²tP₁ + 3(1-t)t²P₂ + t³P₃
-            t = max(0.0, min(1.0, t))  # Clamp t to [0, 1]
-            t2 = t * t
-            t3 = t2 * t
-            mt = 1 - t
-            mt2 = mt * mt
-            mt3 = mt2 * mt
-            
-            x = mt3 * p0[0] + 3 * mt2 * t * p1[0] + 3 * mt * t2 * p2[0] + t3 * p3[0]
-            y = mt3 * p0[1] + 3 * mt2 * t * p1[1] + 3 * mt * t2 * p2[1] + t3 * p3[1]
-            
-            return (x, y)
-        except:
-            return (0, 0)
+        # B(t) = (1-t)³P₀ + 3(1-t)²tP₁ + 3(1-t)t²P₂ + t³P₃
+        t = max(0.0, min(1.0, t))  # Clamp t to [0, 1]
+        t2 = t * t
+        t3 = t2 * t
+        mt = 1 - t
+        mt2 = mt * mt
+        mt3 = mt2 * mt
+
+        x = mt3 * p0[0] + 3 * mt2 * t * p1[0] + 3 * mt * t2 * p2[0] + t3 * p3[0]
+        y = mt3 * p0[1] + 3 * mt2 * t * p1[1] + 3 * mt * t2 * p2[1] + t3 * p3[1]
+
+        return (x, y)
     
     def _cubic_bezier_tangent(self, p0, p1, p2, p3, t):
         """
@@ -498,19 +1208,16 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
         Returns:
             Tangent vector (dx/dt, dy/dt)
         """
-        try:
-            # B'(t) = 3(1-t)²(P₁-P₀) + 6(1-t)t(P₂-P₁) + 3t²(P₃-P₂)
-            t = max(0.0, min(1.0, t))  # Clamp t to [0, 1]
-            mt = 1 - t
-            mt2 = mt * mt
-            t2 = t * t
-            
-            dx = 3 * mt2 * (p1[0] - p0[0]) + 6 * mt * t * (p2[0] - p1[0]) + 3 * t2 * (p3[0] - p2[0])
-            dy = 3 * mt2 * (p1[1] - p0[1]) + 6 * mt * t * (p2[1] - p1[1]) + 3 * t2 * (p3[1] - p2[1])
-            
-            return (dx, dy)
-        except:
-            return (0, 0)
+        # B'(t) = 3(1-t)²(P₁-P₀) + 6(1-t)t(P₂-P₁) + 3t²(P₃-P₂)
+        t = max(0.0, min(1.0, t))  # Clamp t to [0, 1]
+        mt = 1 - t
+        mt2 = mt * mt
+        t2 = t * t
+
+        dx = 3 * mt2 * (p1[0] - p0[0]) + 6 * mt * t * (p2[0] - p1[0]) + 3 * t2 * (p3[0] - p2[0])
+        dy = 3 * mt2 * (p1[1] - p0[1]) + 6 * mt * t * (p2[1] - p1[1]) + 3 * t2 * (p3[1] - p2[1])
+
+        return (dx, dy)
     
     def _cubic_bezier_curvature(self, p0, p1, p2, p3, t):
         """
@@ -524,31 +1231,29 @@ class CurvatureCombPlugin(BaseCanvasPlugin):
         Returns:
             Curvature value (signed)
         """
-        try:
-            # First derivative (tangent)
-            dx, dy = self._cubic_bezier_tangent(p0, p1, p2, p3, t)
-            
-            # Second derivative
-            # B''(t) = 6(1-t)(P₂-2P₁+P₀) + 6t(P₃-2P₂+P₁)
-            mt = 1 - t
-            
-            ddx = 6 * mt * (p2[0] - 2*p1[0] + p0[0]) + 6 * t * (p3[0] - 2*p2[0] + p1[0])
-            ddy = 6 * mt * (p2[1] - 2*p1[1] + p0[1]) + 6 * t * (p3[1] - 2*p2[1] + p1[1])
-            
-            # Curvature formula
-            cross_product = dx * ddy - dy * ddx
-            velocity_squared = dx * dx + dy * dy
-            
-            if velocity_squared < 1e-10:  # Use small epsilon instead of exact zero
-                return 0
-            
-            curvature = cross_product / (velocity_squared ** 1.5)
-            
-            # Clamp to prevent extreme values
-            max_curvature = 1.0
-            if abs(curvature) > max_curvature:
-                return max_curvature if curvature > 0 else -max_curvature
-            
-            return curvature
-        except:
+        # First derivative (tangent)
+        dx, dy = self._cubic_bezier_tangent(p0, p1, p2, p3, t)
+
+        # Second derivative
+        # B''(t) = 6(1-t)(P₂-2P₁+P₀) + 6t(P₃-2P₂+P₁)
+        mt = 1 - t
+
+        ddx = 6 * mt * (p2[0] - 2*p1[0] + p0[0]) + 6 * t * (p3[0] - 2*p2[0] + p1[0])
+        ddy = 6 * mt * (p2[1] - 2*p1[1] + p0[1]) + 6 * t * (p3[1] - 2*p2[1] + p1[1])
+
+        # Curvature formula
+        cross_product = dx * ddy - dy * ddx
+        velocity_squared = dx * dx + dy * dy
+
+        if velocity_squared < 1e-10:  # Use small epsilon instead of exact zero
             return 0
+
+        # v * sqrt(v) avoids the generic pow() path for the 1.5 exponent
+        curvature = cross_product / (velocity_squared * math.sqrt(velocity_squared))
+
+        # Clamp to prevent extreme values
+        max_curvature = 1.0
+        if abs(curvature) > max_curvature:
+            return max_curvature if curvature > 0 else -max_curvature
+
+        return curvature
@@ -18,10 +18,98 @@ Example Canvas Plugin
 Draws the outline filled in black and the glyph's name centered underneath.
 """
 
+import functools
+import re
+from array import array
+
 import js
 
 from base_canvas_plugin.plugin import BaseCanvasPlugin
 
+# Parameters the host has not set yet come back as JS null. Resolve
+# the sentinel class once at import so reads use an isinstance check
+# instead of string-formatting the type on every frame. Outside
+# Pyodide nothing is a JsNull, so any never-instantiated class works
+# as the fallback.
+try:
+    from pyodide.ffi import JsNull as _JsNull
+except ImportError:
+    class _JsNull:
+        pass
+
+
+def _coerce(value, default):
+    """
+    Substitute the default for unset parameter values.
+
+    Args:
+        value: Raw parameter value (may be None or the JS null sentinel)
+        default: Value to use when the parameter is unset
+
+    Returns:
+        The value, or the default when the value is unset
+    """
+    if value is None or isinstance(value, _JsNull):
+        return default
+    return value
+
+# One C-level scan extracts command + coordinate pairs from node
+# strings like "M 100 200 L 300 400". The coordinate pattern covers
+# the full float() grammar - leading dot, explicit sign, exponent -
+# so no node the baseline parser accepted is silently dropped
+_FLOAT = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+_NODE_RE = re.compile(
+    rf'([MLCQ])\s+({_FLOAT})\s+({_FLOAT})'
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _font_spec(half_px):
+    """
+    Compose the ctx.font string for a font size in half-pixel steps.
+
+    Quantizing to 0.5px keeps the cache small across zoom levels while
+    staying visually indistinguishable, and reuses the composed string
+    instead of rebuilding it every frame.
+
+    Args:
+        half_px: Font size in half-pixel units (size * 2, rounded)
+
+    Returns:
+        CSS font shorthand string
+    """
+    return f'{half_px * 0.5}px sans-serif'
+
+
+@functools.lru_cache(maxsize=32)
+def _compose_style(color_hex, alpha, mode):
+    """
+    Compose the CSS color string for a fill/stroke configuration.
+
+    Hex parsing and rgba formatting only depend on the three settings,
+    so results are memoized; redraws with unchanged settings reuse the
+    cached string.
+
+    Args:
+        color_hex: Hex color string (e.g., '#0000ff')
+        alpha: Opacity value (0.0 to 1.0)
+        mode: Drawing mode ('normal', 'outline', 'filled')
+
+    Returns:
+        Tuple (style_string, is_stroke)
+    """
+    color = color_hex.lstrip('#')
+    r = int(color[0:2], 16)
+    g = int(color[2:4], 16)
+    b = int(color[4:6], 16)
+    return f'rgba({r}, {g}, {b}, {alpha})', mode == 'outline'
+
+# NumPy ships with Pyodide; fall back to the scalar loop without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class ExampleCanvasPlugin(BaseCanvasPlugin):
     """
@@ -102,40 +190,44 @@ class ExampleCanvasPlugin(BaseCanvasPlugin):
             return
         
         # Get UI parameter values
-        opacity = self.get_parameter('opacity')
-        if opacity is None or str(type(opacity)) == "<class 'pyodide.ffi.JsNull'>":
-            opacity = 50
+        opacity = _coerce(self.get_parameter('opacity'), 50)
         opacity_alpha = opacity / 100.0
+        label_text = _coerce(self.get_parameter('label_text'), 'Custom')
+        show_info = _coerce(self.get_parameter('show_info'), True)
+        display_mode = _coerce(self.get_parameter('display_mode'), 'filled')
+        fill_color = _coerce(self.get_parameter('fill_color'), '#0000ff')
         
-        label_text = self.get_parameter('label_text')
-        if label_text is None or str(type(label_text)) == "<class 'pyodide.ffi.JsNull'>":
-            label_text = 'Custom'
-        
-        show_info = self.get_parameter('show_info')
-        if show_info is None or str(type(show_info)) == "<class 'pyodide.ffi.JsNull'>":
-            show_info = True
-        
-        display_mode = self.get_parameter('display_mode')
-        if display_mode is None or str(type(display_mode)) == "<class 'pyodide.ffi.JsNull'>":
-            display_mode = 'filled'
-        
-        fill_color = self.get_parameter('fill_color')
-        if fill_color is None or str(type(fill_color)) == "<class 'pyodide.ffi.JsNull'>":
-            fill_color = '#0000ff'
-        
-        # Calculate bounding box of all shapes
-        bbox = self._calculate_bbox(layer_data['shapes'])
-        if not bbox:
-            return
-        
-        min_x, min_y, max_x, max_y = bbox
-        
+        shapes = layer_data['shapes']
+
         # Note: The renderer already saves/restores the context around plugin calls,
         # so we don't need to do it here at the top level
-        
-        # Draw filled outline based on display mode (skip in normal mode)
+
+        # Draw filled outline based on display mode (skip in normal
+        # mode). The draw pass measures the bbox from the nodes it
+        # already traverses, so drawing frames need no separate bbox
+        # pass; the result seeds the bbox cache for later frames.
+        bbox = None
         if display_mode != 'normal':
-            self._draw_filled_outline(ctx, layer_data['shapes'], display_mode, opacity_alpha, fill_color)
+            bbox = self._draw_filled_outline(
+                ctx, shapes, display_mode, opacity_alpha, fill_color,
+                self._visible_rect(ctx)
+            )
+            if bbox is not None:
+                key = self._shapes_key(shapes)
+                if key is not None:
+                    cache = getattr(self, '_bbox_cache', None)
+                    if cache is None:
+                        cache = self._bbox_cache = {}
+                    if len(cache) >= 16:
+                        # Evict the oldest entry (insertion order)
+                        cache.pop(next(iter(cache)))
+                    cache[key] = bbox
+        if bbox is None:
+            bbox = self._calculate_bbox_cached(shapes)
+        if not bbox:
+            return
+
+        min_x, min_y, max_x, max_y = bbox
         
         # Draw glyph info if enabled
         if show_info:
@@ -149,6 +241,81 @@ class ExampleCanvasPlugin(BaseCanvasPlugin):
             
             self._draw_glyph_name(ctx, info_text, min_x, max_x, min_y, viewport_manager)
     
+    def _calculate_bbox_cached(self, shapes, _max_entries=16):
+        """
+        Cached wrapper around _calculate_bbox.
+
+        draw_below runs on every repaint, but the bbox only changes when
+        the shapes do. Results are cached keyed by a hash of the shape
+        content, so pan/zoom repaints skip the node traversal entirely;
+        identity keys would alias recycled ids because the host rebuilds
+        the shapes for every draw call. The cache holds the most recent
+        _max_entries layers.
+
+        Args:
+            shapes: List of shape dictionaries
+
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y) or None
+        """
+        key = self._shapes_key(shapes)
+        if key is None:
+            # Unhashable shape content - measure without caching
+            return self._calculate_bbox(shapes)
+
+        cache = getattr(self, '_bbox_cache', None)
+        if cache is None:
+            cache = self._bbox_cache = {}
+
+        if key in cache:
+            return cache[key]
+
+        bbox = self._calculate_bbox(shapes)
+        if len(cache) >= _max_entries:
+            # Evict the oldest entry (insertion order)
+            cache.pop(next(iter(cache)))
+        cache[key] = bbox
+        return bbox
+
+    @staticmethod
+    def _shapes_key(shapes):
+        """
+        Content hash of a whole shapes list for the bbox cache.
+
+        Keyed on what _calculate_bbox actually reads per shape: the
+        precomputed bbox when one exists, otherwise the node content.
+        Like _nodes_key, this stays valid across the host's per-frame
+        layer_data rebuilds where id()-based keys would not.
+
+        Args:
+            shapes: List of shape dictionaries
+
+        Returns:
+            Hash of the shape content, or None when it is unhashable
+        """
+        try:
+            items = []
+            for shape in shapes:
+                bbox = shape.get('bbox')
+                if bbox is None and 'Path' in shape:
+                    bbox = shape['Path'].get('bbox')
+                if bbox is not None and len(bbox) == 4:
+                    items.append(tuple(bbox))
+                    continue
+                nodes = shape.get('nodes', [])
+                if not nodes and 'Path' in shape:
+                    nodes = shape['Path'].get('nodes', [])
+                if isinstance(nodes, str):
+                    items.append(nodes)
+                else:
+                    items.append(tuple(
+                        (n.get('x'), n.get('y'))
+                        for n in nodes if isinstance(n, dict)
+                    ))
+            return hash(tuple(items))
+        except TypeError:
+            return None
+
     def _calculate_bbox(self, shapes):
         """
         Calculate the bounding box of all shapes.
@@ -161,28 +328,65 @@ class ExampleCanvasPlugin(BaseCanvasPlugin):
         """
         min_x = min_y = float('inf')
         max_x = max_y = float('-inf')
-        found_coords = False
-        
+        found_bbox = False
+
+        # Collect coordinates once, then reduce in C instead of running
+        # four scalar min/max calls per node in the Python loop. Shapes
+        # that already carry a precomputed bbox are folded in directly -
+        # four numbers per shape instead of a walk over all its nodes.
+        pairs = []
         for shape in shapes:
+            bbox = shape.get('bbox')
+            if bbox is None and 'Path' in shape:
+                bbox = shape['Path'].get('bbox')
+            if bbox is not None and len(bbox) == 4:
+                min_x = min(min_x, bbox[0])
+                min_y = min(min_y, bbox[1])
+                max_x = max(max_x, bbox[2])
+                max_y = max(max_y, bbox[3])
+                found_bbox = True
+                continue
+
             if 'Path' in shape:
                 path = shape['Path']
                 nodes = path.get('nodes', [])
-                
-                # Parse nodes if they're a string
+
+                # String nodes parse straight into compact buffers;
+                # min/max run C-level over the contiguous arrays
+                # without building a dict per node
                 if isinstance(nodes, str):
-                    nodes = self._parse_nodes_string(nodes)
-                
+                    xs, ys, _ = self._parse_nodes_arrays(nodes)
+                    if xs:
+                        min_x = min(min_x, min(xs))
+                        min_y = min(min_y, min(ys))
+                        max_x = max(max_x, max(xs))
+                        max_y = max(max_y, max(ys))
+                        found_bbox = True
+                    continue
+
                 for node in nodes:
                     if isinstance(node, dict):
-                        x = node.get('x', 0)
-                        y = node.get('y', 0)
-                        min_x = min(min_x, x)
-                        min_y = min(min_y, y)
-                        max_x = max(max_x, x)
-                        max_y = max(max_y, y)
-                        found_coords = True
-        
-        return (min_x, min_y, max_x, max_y) if found_coords else None
+                        pairs.append((node.get('x', 0), node.get('y', 0)))
+
+        if pairs:
+            if np is not None:
+                pts = np.asarray(pairs, dtype=np.float64)
+                min_x = min(min_x, float(pts[:, 0].min()))
+                min_y = min(min_y, float(pts[:, 1].min()))
+                max_x = max(max_x, float(pts[:, 0].max()))
+                max_y = max(max_y, float(pts[:, 1].max()))
+            else:
+                # min()/max() drain the unzipped sequences in a tight
+                # C loop - no Python-level comparison per point
+                xs, ys = zip(*pairs)
+                min_x = min(min_x, min(xs))
+                min_y = min(min_y, min(ys))
+                max_x = max(max_x, max(xs))
+                max_y = max(max_y, max(ys))
+        elif not found_bbox:
+            return None
+
+        return (min_x, min_y, max_x, max_y)
     
     def _parse_nodes_string(self, nodes_str):
         """
@@ -194,33 +398,87 @@ class ExampleCanvasPlugin(BaseCanvasPlugin):
         Returns:
             List of node dictionaries
         """
-        # Simple parser for node strings like "M 100 200 L 300 400"
-        # This is a simplified version - the real implementation might be more complex
-        nodes = []
+        # Simple parser for node strings like "M 100 200 L 300 400".
+        # The precompiled regex scans the string once in C instead of
+        # splitting into a token list and walking it in Python.
         if not nodes_str:
-            return nodes
-        
-        parts = nodes_str.strip().split()
-        i = 0
-        while i < len(parts):
-            node_type = parts[i]
-            if node_type in ('M', 'L', 'C', 'Q'):
-                if i + 2 < len(parts):
-                    try:
-                        x = float(parts[i + 1])
-                        y = float(parts[i + 2])
-                        nodes.append({'type': node_type, 'x': x, 'y': y})
-                        i += 3
-                    except ValueError:
-                        i += 1
-                else:
-                    break
-            else:
-                i += 1
-        
-        return nodes
+            return []
+        return [
+            {'type': m[1], 'x': float(m[2]), 'y': float(m[3])}
+            for m in _NODE_RE.finditer(nodes_str)
+        ]
+
+    def _parse_nodes_arrays(self, nodes_str):
+        """
+        Parse a nodes string into compact coordinate buffers.
+
+        Each node dict costs a couple of hundred bytes plus a boxed
+        float per coordinate. For bulk consumers like the bbox pass the
+        coordinates go straight into contiguous array('d') buffers
+        (8 bytes per value) with one type byte per node; min()/max()
+        then drain the buffers in C. _parse_nodes_string stays as the
+        dict-shaped accessor for the legacy API boundary.
+
+        Args:
+            nodes_str: String representation of nodes
+
+        Returns:
+            Tuple (xs, ys, types): two array('d') buffers and a bytes
+            object of command characters
+        """
+        xs = array('d')
+        ys = array('d')
+        types = bytearray()
+        if nodes_str:
+            for m in _NODE_RE.finditer(nodes_str):
+                types.append(ord(m[1]))
+                xs.append(float(m[2]))
+                ys.append(float(m[3]))
+        return xs, ys, bytes(types)
     
-    def _draw_filled_outline(self, ctx, shapes, display_mode='normal', opacity_alpha=0.5, fill_color='#0000ff'):
+    def _visible_rect(self, ctx):
+        """
+        Compute the visible rect in the local drawing space.
+
+        The host calls plugins with the full canvas transform already
+        applied - the DPR scale, the viewport matrix and the selected
+        glyph's translate within the text run - so the rect is derived
+        by inverting the live matrix from ctx.getTransform().
+        Rebuilding the viewport matrix alone would displace the rect by
+        the glyph offset for any selected glyph past the first and cull
+        fully on-screen shapes.
+
+        Args:
+            ctx: Canvas 2D rendering context
+
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y) or None if unavailable
+        """
+        try:
+            m = ctx.getTransform()
+            a, b, c, d, e, f = m.a, m.b, m.c, m.d, m.e, m.f
+            det = a * d - b * c
+            if not det:
+                return None
+            width = ctx.canvas.width
+            height = ctx.canvas.height
+            # Map the canvas corners through the inverse matrix; the
+            # min/max bound stays correct under rotated component
+            # transforms too
+            xs = []
+            ys = []
+            for px, py in ((0, 0), (width, 0), (0, height),
+                           (width, height)):
+                dx = px - e
+                dy = py - f
+                xs.append((dx * d - dy * c) / det)
+                ys.append((dy * a - dx * b) / det)
+            return (min(xs), min(ys), max(xs), max(ys))
+        except Exception:
+            return None
+
+    def _draw_filled_outline(self, ctx, shapes, display_mode='normal', opacity_alpha=0.5, fill_color='#0000ff',
+                             visible_rect=None):
         """
         Draw all paths based on the display mode. All contours are added to a single path
         before filling, which allows the canvas to properly handle counters
@@ -232,92 +490,220 @@ class ExampleCanvasPlugin(BaseCanvasPlugin):
             display_mode: Drawing mode ('normal', 'outline', 'filled')
             opacity_alpha: Opacity value (0.0 to 1.0)
             fill_color: Hex color string (e.g., '#0000ff')
+            visible_rect: Optional (min_x, min_y, max_x, max_y) in font
+                space; shapes with a precomputed bbox fully outside it
+                are not emitted
+
+        Returns:
+            Bounding box (min_x, min_y, max_x, max_y) of the traversed
+            nodes, or None when nothing was drawn
         """
-        # Convert hex color to RGB components
-        # Remove '#' if present
-        color = fill_color.lstrip('#')
-        # Parse hex to RGB
-        r = int(color[0:2], 16)
-        g = int(color[2:4], 16)
-        b = int(color[4:6], 16)
-        
-        # Set style based on mode
-        if display_mode == 'outline':
-            ctx.strokeStyle = f'rgba({r}, {g}, {b}, {opacity_alpha})'
+        # Set style based on mode; the string composition is memoized
+        style, is_stroke = _compose_style(fill_color, opacity_alpha, display_mode)
+        if is_stroke:
+            ctx.strokeStyle = style
             ctx.lineWidth = 10
-        elif display_mode == 'filled':
-            ctx.fillStyle = f'rgba({r}, {g}, {b}, {opacity_alpha})'
-        else:  # normal
-            ctx.fillStyle = f'rgba({r}, {g}, {b}, {opacity_alpha})'
-        
-        # Begin a single path for all contours - this allows counters to work correctly
-        ctx.beginPath()
+        else:
+            ctx.fillStyle = style
         
+        # Accumulate all contours as one SVG path-data string; a single
+        # Path2D construction plus one fill/stroke replaces the
+        # per-segment moveTo/lineTo/bezierCurveTo FFI crossings. The
+        # bbox is folded in from the same coordinate arrays, so the
+        # nodes are only traversed once per frame.
+        parts = []
+        drawn_keys = []
+        cacheable = True
+        min_x = min_y = float('inf')
+        max_x = max_y = float('-inf')
+
         for shape in shapes:
+            # A precomputed bbox is both the viewport reject test and
+            # this shape's contribution to the measured bbox, whether
+            # the shape ends up culled or drawn. _calculate_bbox
+            # prefers it the same way, so the fused measurement matches
+            # the cached value regardless of what the viewport culls.
+            shape_bbox = shape.get('bbox')
+            if shape_bbox is None and 'Path' in shape:
+                shape_bbox = shape['Path'].get('bbox')
+            if shape_bbox is not None and len(shape_bbox) != 4:
+                shape_bbox = None
+            if shape_bbox is not None:
+                min_x = min(min_x, shape_bbox[0])
+                min_y = min(min_y, shape_bbox[1])
+                max_x = max(max_x, shape_bbox[2])
+                max_y = max(max_y, shape_bbox[3])
+                if visible_rect is not None and (
+                    shape_bbox[2] < visible_rect[0]
+                    or shape_bbox[0] > visible_rect[2]
+                    or shape_bbox[3] < visible_rect[1]
+                    or shape_bbox[1] > visible_rect[3]
+                ):
+                    continue
+
             # Get nodes - they can be at shape['nodes'] or shape['Path']['nodes']
             nodes = shape.get('nodes', [])
             if not nodes and 'Path' in shape:
                 nodes = shape['Path'].get('nodes', [])
-            
+
             if not nodes:
                 continue
-            
-            # Find first on-curve point to start
-            start_idx = 0
-            for i, node in enumerate(nodes):
-                if node.get('nodetype') in ('c', 'cs', 'l', 'ls'):
-                    start_idx = i
-                    break
-            
-            # Move to start point (adds new subpath without ending previous ones)
-            start_node = nodes[start_idx]
-            ctx.moveTo(start_node['x'], start_node['y'])
-            
-            # Draw the path
-            i = 0
-            while i < len(nodes):
-                idx = (start_idx + i) % len(nodes)
-                next_idx = (start_idx + i + 1) % len(nodes)
-                next2_idx = (start_idx + i + 2) % len(nodes)
-                next3_idx = (start_idx + i + 3) % len(nodes)
-                
-                node = nodes[idx]
-                node_type = node.get('nodetype', 'l')
-                
-                # Check if next points are off-curve (cubic bezier)
-                if next_idx < len(nodes):
-                    next_node = nodes[next_idx]
-                    next_type = next_node.get('nodetype', 'l')
-                    
-                    if next_type == 'o':  # Next is off-curve (control point)
-                        # This is a cubic bezier curve
-                        cp1 = next_node
-                        cp2 = nodes[next2_idx]
-                        end = nodes[next3_idx]
-                        
-                        ctx.bezierCurveTo(
-                            cp1['x'], cp1['y'],
-                            cp2['x'], cp2['y'],
-                            end['x'], end['y']
-                        )
-                        i += 3  # Skip control points and endpoint
-                    else:
-                        # Straight line to next on-curve point
-                        ctx.lineTo(next_node['x'], next_node['y'])
-                        i += 1
-                else:
-                    i += 1
-            
-            # Close this subpath (but don't fill yet)
-            ctx.closePath()
-        
+
+            cache_key = self._nodes_key(nodes)
+            d, extents = self._shape_path_data(nodes, cache_key)
+
+            # Fold this shape into the bbox (precomputed bboxes were
+            # folded above)
+            if shape_bbox is None:
+                min_x = min(min_x, extents[0])
+                min_y = min(min_y, extents[1])
+                max_x = max(max_x, extents[2])
+                max_y = max(max_y, extents[3])
+
+            parts.append(d)
+            if cache_key is None:
+                cacheable = False
+            else:
+                drawn_keys.append(cache_key)
+
+        if not parts:
+            return None
+
+        # The compiled Path2D is invariant while the drawn shapes are,
+        # so it is cached on the tuple of their keys; steady-state
+        # redraws collapse to one ctx.fill/stroke of the cached object.
+        # All contours stay in one Path2D because counters depend on
+        # opposite-direction subpaths meeting in the same fill.
+        p_cache = getattr(self, '_path2d_cache', None)
+        if p_cache is None:
+            p_cache = self._path2d_cache = {}
+        path = None
+        if cacheable:
+            combined_key = tuple(drawn_keys)
+            path = p_cache.get(combined_key)
+        if path is None:
+            path = js.Path2D.new(' '.join(parts))
+            if cacheable:
+                if len(p_cache) >= 64:
+                    # Evict the oldest entry (insertion order)
+                    p_cache.pop(next(iter(p_cache)))
+                p_cache[combined_key] = path
+
         # Fill or stroke all contours at once based on mode
         if display_mode == 'outline':
-            ctx.stroke()
+            ctx.stroke(path)
         else:
             # Fill all contours - the canvas uses the nonzero winding rule
             # to automatically create counters (holes) where paths have opposite directions
-            ctx.fill()
+            ctx.fill(path)
+
+        return (min_x, min_y, max_x, max_y)
+
+    @staticmethod
+    def _nodes_key(nodes):
+        """
+        Content hash of a shape's node list for cache keys.
+
+        The host rebuilds layer_data for every draw call and destroys
+        it afterwards, so object identities get recycled and id()-based
+        keys can alias a stale entry; a hash of the node content stays
+        valid across rebuilds and changes with any edit.
+
+        Args:
+            nodes: List of node dictionaries
+
+        Returns:
+            Hash of the node content, or None when it is unhashable
+        """
+        try:
+            return hash(tuple(
+                (n.get('nodetype'), n.get('x'), n.get('y'))
+                for n in nodes if isinstance(n, dict)
+            ))
+        except TypeError:
+            return None
+
+    def _shape_path_data(self, nodes, cache_key, _max_entries=256):
+        """
+        Get the SVG path-data string and extents for one shape.
+
+        The path data is a property of the nodes, not the frame, so it
+        is memoized by a hash of the node content; the node walk only
+        runs the first time a path is seen.
+
+        Args:
+            nodes: List of node dictionaries
+            cache_key: Content hash from _nodes_key, or None to skip
+                caching
+            _max_entries: Cache size bound
+
+        Returns:
+            Tuple (d, (min_x, min_y, max_x, max_y))
+        """
+        cache = getattr(self, '_shape_path_cache', None)
+        if cache is None:
+            cache = self._shape_path_cache = {}
+
+        if cache_key is not None:
+            entry = cache.get(cache_key)
+            if entry is not None:
+                return entry
+
+        # Find first on-curve point to start
+        start_idx = 0
+        for i, node in enumerate(nodes):
+            if node.get('nodetype') in ('c', 'cs', 'l', 'ls'):
+                start_idx = i
+                break
+
+        # Pre-resolve the rotated node ring into parallel coordinate
+        # and type arrays; padding with three wrap copies lets the loop
+        # index forward without the four modulo operations and dict
+        # lookups per step. The padding cycles the ring so degenerate
+        # one- or two-node paths still get three full entries, matching
+        # the modulo indexing they resolved to before
+        ring = nodes[start_idx:] + nodes[:start_idx]
+        ring += (ring * 3)[:3]
+        xs = [n['x'] for n in ring]
+        ys = [n['y'] for n in ring]
+        ts = [n.get('nodetype', 'l') for n in ring]
+
+        # Move to start point (starts a new subpath)
+        parts = [f'M {xs[0]} {ys[0]}']
+        append = parts.append
+
+        # Emit the path commands
+        i = 0
+        count = len(nodes)
+        while i < count:
+            if ts[i + 1] == 'o':  # Next is off-curve (control point)
+                # This is a cubic bezier curve
+                append(
+                    f'C {xs[i + 1]} {ys[i + 1]} '
+                    f'{xs[i + 2]} {ys[i + 2]} '
+                    f'{xs[i + 3]} {ys[i + 3]}'
+                )
+                i += 3  # Skip control points and endpoint
+            else:
+                # Straight line to next on-curve point
+                append(f'L {xs[i + 1]} {ys[i + 1]}')
+                i += 1
+
+        # Close this subpath (but don't fill yet)
+        append('Z')
+
+        # Extents via C-level min/max; the three padded wrap entries
+        # are duplicates and cannot widen them
+        entry = (
+            ' '.join(parts),
+            (min(xs), min(ys), max(xs), max(ys)),
+        )
+        if cache_key is not None:
+            if len(cache) >= _max_entries:
+                # Evict the oldest entry (insertion order)
+                cache.pop(next(iter(cache)))
+            cache[cache_key] = entry
+        return entry
         
     
     def _draw_glyph_name(self, ctx, glyph_name, min_x, max_x, min_y, viewport_manager):
@@ -346,13 +732,35 @@ class ExampleCanvasPlugin(BaseCanvasPlugin):
         # 20px on screen should translate to design space
         inv_scale = 1 / viewport_manager.scale
         font_size_design = 20 * inv_scale
-        
-        # Set up text rendering
+
+        # The label is a fixed 20 screen pixels, so the rasterized text
+        # is identical across frames; reuse a cached bitmap and blit it
+        # instead of re-shaping and re-rasterizing through fillText.
+        # Transforms stay relative: the live matrix also carries the
+        # DPR scale and the glyph's translate within the text run, so
+        # absolute setTransform coordinates would land in the wrong
+        # place and leave a corrupted matrix for plugins drawn after
+        # this one in the same pass.
+        bitmap = self._text_bitmap(glyph_name, 20)
+        if bitmap is not None:
+            ctx.save()
+            ctx.translate(center_x, text_y)
+            # Counter the viewport zoom so the label stays 20 screen
+            # pixels; the flip renders the bitmap upright
+            ctx.scale(inv_scale, -inv_scale)
+            ctx.drawImage(bitmap, -bitmap.width / 2, 0)
+            ctx.restore()
+            return
+
+        # Set up text rendering. The font spec string is cached on the
+        # quantized size; the assignments themselves cannot be skipped
+        # because the renderer restores the context state around every
+        # plugin call.
         ctx.fillStyle = 'rgba(128, 128, 128, 0.8)'  # Semi-transparent gray
-        ctx.font = f'{font_size_design}px sans-serif'
+        ctx.font = _font_spec(round(font_size_design * 2))
         ctx.textAlign = 'center'
         ctx.textBaseline = 'top'
-        
+
         # Draw text at position
         # The canvas context is already in font coordinate space with Y-axis flipped by viewport.
         # Text renders correctly without additional transformation.
@@ -361,3 +769,52 @@ class ExampleCanvasPlugin(BaseCanvasPlugin):
         ctx.scale(1, -1)  # Flip y-axis so text appears upright
         ctx.fillText(glyph_name, 0, 0)
         ctx.restore()
+
+    def _text_bitmap(self, text, px_size, _max_entries=512):
+        """
+        Render label text once into an OffscreenCanvas and cache it.
+
+        fillText re-shapes and re-rasterizes the same string on every
+        frame; the bitmap only depends on the text and its pixel size,
+        so it is drawn once offscreen and blitted afterwards. The cache
+        holds the most recent _max_entries labels.
+
+        Args:
+            text: Label text
+            px_size: Font size in screen pixels
+            _max_entries: Cache size bound
+
+        Returns:
+            OffscreenCanvas with the rendered text, or None when
+            OffscreenCanvas is unavailable
+        """
+        offscreen_canvas = getattr(js, 'OffscreenCanvas', None)
+        if offscreen_canvas is None:
+            return None
+
+        cache = getattr(self, '_text_cache', None)
+        if cache is None:
+            cache = self._text_cache = {}
+
+        key = (text, px_size)
+        canvas = cache.get(key)
+        if canvas is None:
+            try:
+                canvas = offscreen_canvas.new(1, 1)
+                octx = canvas.getContext('2d')
+                font = f'{px_size}px sans-serif'
+                octx.font = font
+                canvas.width = int(octx.measureText(text).width) + 2
+                canvas.height = int(px_size * 1.4) + 2
+                # Resizing resets the context state
+                octx.font = font
+                octx.fillStyle = 'rgba(128, 128, 128, 0.8)'
+                octx.textBaseline = 'top'
+                octx.fillText(text, 1, 1)
+            except Exception:
+                return None
+            if len(cache) >= _max_entries:
+                # Evict the oldest entry (insertion order)
+                cache.pop(next(iter(cache)))
+            cache[key] = canvas
+        return canvas
@@ -108,7 +108,11 @@ class BaseGlyphFilterPlugin:
         - A raw CSS color (hex, named, rgb(), etc.) → auto-generates a group for the legend
         
         When filtering by groups in the UI, glyphs will appear if they match ANY of the selected groups.
-        
+
+        Prefer `yield` over building a full list: on large fonts a
+        generator keeps peak memory at O(1) per glyph and lets the host
+        start consuming results before the whole font has been scanned.
+
         Args:
             font: The font object (babelfont model)
             
@@ -157,6 +161,50 @@ class BaseGlyphFilterPlugin:
                     # If glyph has both, it will appear once with both groups merged
             
         Returns:
-            List of filter result dicts (or generator yielding them)
+            Iterable of filter result dicts (list or generator)
         """
+        # A plain empty list, not iter(()): the host only materializes
+        # real generators before converting, and a tuple iterator would
+        # cross the bridge as an opaque PyProxy
         return []
+
+    @classmethod
+    def merge_results(cls, results):
+        """
+        Merge streamed filter results by glyph name.
+
+        Glyphs emitted multiple times with different 'group' values are
+        folded into one entry carrying every group seen, preserving
+        first-seen glyph order. Accepts any iterable, so generator-based
+        filters can be merged without materializing intermediate lists.
+
+        Args:
+            results: Iterable of filter result dicts
+
+        Returns:
+            Generator yielding one merged dict per glyph
+        """
+        merged = {}
+        for result in results:
+            name = result.get('glyph_name')
+            if name is None:
+                continue
+            groups = merged.get(name)
+            if groups is None:
+                groups = merged[name] = []
+            if 'groups' in result:
+                for group in result['groups']:
+                    if group not in groups:
+                        groups.append(group)
+            elif 'group' in result:
+                group = result['group']
+                if group not in groups:
+                    groups.append(group)
+
+        for name, groups in merged.items():
+            if not groups:
+                yield {'glyph_name': name}
+            elif len(groups) == 1:
+                yield {'glyph_name': name, 'group': groups[0]}
+            else:
+                yield {'glyph_name': name, 'groups': groups}
@@ -21,5 +21,11 @@ Provides basic glyph filters: All Glyphs, Encoded Characters, Unencoded Glyphs.
 from .all_glyphs import AllGlyphsFilter
 from .encoded_glyphs import EncodedGlyphsFilter
 from .unencoded_glyphs import UnencodedGlyphsFilter
+from .fused import run_all_filters
 
-__all__ = ['AllGlyphsFilter', 'EncodedGlyphsFilter', 'UnencodedGlyphsFilter']
+__all__ = [
+    'AllGlyphsFilter',
+    'EncodedGlyphsFilter',
+    'UnencodedGlyphsFilter',
+    'run_all_filters',
+]
@@ -0,0 +1,44 @@
+# Copyright (C) 2025 Yanone
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Per-font memoization helper shared by the general glyph filters.
+
+Sidebar refreshes call every filter again even when the font has not
+changed; a cheap fingerprint lets the filters answer repeat calls from
+a small per-instance cache instead of rescanning all glyphs.
+"""
+
+
+def font_fingerprint(font):
+    """
+    Build a cheap identity fingerprint for a font.
+
+    Object identity plus revision (when the model tracks one) plus the
+    glyph count catches the common invalidation cases - reload, edit
+    with revision bump, glyph add/remove - without hashing glyph data.
+
+    Args:
+        font: The font object (babelfont model)
+
+    Returns:
+        Hashable tuple usable as a cache key
+    """
+    glyphs = getattr(font, 'glyphs', None)
+    try:
+        count = len(glyphs) if glyphs is not None else 0
+    except TypeError:
+        count = -1
+    return (id(font), getattr(font, 'revision', None), count)
@@ -17,34 +17,78 @@
 All Glyphs Filter - shows all glyphs in the font.
 """
 
+from ._caching import font_fingerprint
+
 
 class AllGlyphsFilter:
     """Filter that returns all glyphs in the font."""
-    
+
     path = "basic"
     keyword = "com.context.allglyphs"
     display_name = "All Glyphs"
-    
+
     def __init__(self):
-        pass
-    
+        self._cache = {}
+
     def visible(self):
         return True
-    
+
     def get_groups(self):
         return {}
-    
+
     def filter_glyphs(self, font):
-        """Return all glyphs in the font."""
-        results = []
-        
+        """Return all glyphs in the font, cached per font fingerprint."""
+        key = font_fingerprint(font)
+        results = self._cache.get(key)
+        if results is None:
+            # Late import: fused imports this module at load time
+            from .fused import compute_general_filters
+
+            results = compute_general_filters(font)[self.keyword]
+            if len(self._cache) >= 4:
+                # Evict the oldest entry (insertion order)
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = results
+        return results
+
+    def iter_filter_glyphs(self, font):
+        """
+        Yield filter results one glyph at a time.
+
+        Serves from the per-font cache when warm; otherwise streams the
+        scan so consumers that iterate once never hold the full result
+        list. Streamed results are not cached since the consumer may
+        stop early.
+        """
+        cached = self._cache.get(font_fingerprint(font))
+        if cached is not None:
+            yield from cached
+        else:
+            yield from self._iter_scan(font)
+
+    def _scan_glyphs(self, font):
+        """Scan the font and build the result list."""
+        # Comprehension instead of list(self._iter_scan(...)): the list
+        # path is the hot one and the comprehension skips the generator
+        # frame plus the per-item append dispatch
+        glyphs = getattr(font, 'glyphs', None) or ()
+        _getattr = getattr
+        return [
+            {"glyph_name": name}
+            for glyph in glyphs
+            if (name := _getattr(glyph, 'name', None))
+        ]
+
+    def _iter_scan(self, font):
+        """Scan the font, yielding one result dict per glyph."""
         glyphs = getattr(font, 'glyphs', None)
         if glyphs is None:
-            return results
-        
+            return
+
+        # Bind per-iteration lookups once; getattr keeps its default so
+        # proxy objects without the attribute stay harmless
+        _getattr = getattr
         for glyph in glyphs:
-            glyph_name = getattr(glyph, 'name', None)
+            glyph_name = _getattr(glyph, 'name', None)
             if glyph_name:
-                results.append({"glyph_name": glyph_name})
-        
-        return results
+                yield {"glyph_name": glyph_name}
@@ -0,0 +1,124 @@
+# Copyright (C) 2025 Yanone
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared single-pass execution of the general glyph filters.
+
+The three filters iterate the same glyph list and read the same two
+attributes per glyph, so running them separately triples the attribute
+traffic. The helpers here read each glyph once into lightweight rows
+and derive all three result lists from that one pass. Threads are no
+alternative in this runtime: Pyodide executes on a single WASM thread.
+"""
+
+from collections import namedtuple
+from types import SimpleNamespace
+
+from ._caching import font_fingerprint
+from .all_glyphs import AllGlyphsFilter
+from .encoded_glyphs import EncodedGlyphsFilter
+from .unencoded_glyphs import UnencodedGlyphsFilter
+
+# Minimal glyph view carrying just the two attributes the filters read
+_RowGlyph = namedtuple('_RowGlyph', ['name', 'codepoints'])
+
+_FUSED_KEYWORDS = (
+    AllGlyphsFilter.keyword,
+    EncodedGlyphsFilter.keyword,
+    UnencodedGlyphsFilter.keyword,
+)
+
+# Scanner instance for the encoded classification over collected rows
+_encoded_scanner = EncodedGlyphsFilter()
+
+
+def _collect_rows(font):
+    """Read name and codepoints of every glyph in one pass."""
+    glyphs = getattr(font, 'glyphs', None) or ()
+    _getattr = getattr
+    rows = []
+    rows_append = rows.append
+    for glyph in glyphs:
+        name = _getattr(glyph, 'name', None)
+        if name:
+            rows_append(_RowGlyph(name, _getattr(glyph, 'codepoints', None)))
+    return rows
+
+
+def _results_from_rows(rows):
+    """Build all three filter result lists from collected rows."""
+    encoded_rows = [r for r in rows if r.codepoints]
+    return {
+        AllGlyphsFilter.keyword: [{"glyph_name": r.name} for r in rows],
+        EncodedGlyphsFilter.keyword: _encoded_scanner._scan_glyphs(
+            SimpleNamespace(glyphs=encoded_rows)
+        ),
+        UnencodedGlyphsFilter.keyword: [
+            {"glyph_name": r.name} for r in rows if not r.codepoints
+        ],
+    }
+
+
+# Per-font memo over the fused pass, keyed like the per-filter caches
+_fused_cache = {}
+
+
+def compute_general_filters(font):
+    """
+    Compute all three general filter results in one glyph pass.
+
+    Memoized per font fingerprint, so the filters can each delegate
+    their cache-miss scan here and the first one to ask pays for the
+    single pass that serves all three.
+
+    Args:
+        font: The font object (babelfont model)
+
+    Returns:
+        Dict mapping each general filter keyword to its result list
+    """
+    key = font_fingerprint(font)
+    results = _fused_cache.get(key)
+    if results is None:
+        results = _results_from_rows(_collect_rows(font))
+        if len(_fused_cache) >= 4:
+            # Evict the oldest entry (insertion order)
+            _fused_cache.pop(next(iter(_fused_cache)))
+        _fused_cache[key] = results
+    return results
+
+
+def run_all_filters(font, filters):
+    """
+    Run several glyph filters over a single pass of the font.
+
+    The three general filters are served from one shared glyph scan;
+    any other filter in the list falls back to its own filter_glyphs.
+
+    Args:
+        font: The font object (babelfont model)
+        filters: Iterable of filter instances with a keyword attribute
+
+    Returns:
+        Dict mapping each filter's keyword to its result list
+    """
+    results = {}
+    for flt in filters:
+        keyword = getattr(flt, 'keyword', None)
+        if keyword in _FUSED_KEYWORDS:
+            results[keyword] = compute_general_filters(font)[keyword]
+        else:
+            results[keyword] = flt.filter_glyphs(font)
+    return results
@@ -17,6 +17,8 @@
 Unencoded Glyphs Filter - shows glyphs without a Unicode codepoint.
 """
 
+from ._caching import font_fingerprint
+
 
 class UnencodedGlyphsFilter:
     """Filter that returns glyphs without any Unicode codepoint."""
@@ -26,30 +28,92 @@ class UnencodedGlyphsFilter:
     display_name = "Unencoded Glyphs"
     
     def __init__(self):
-        pass
-    
+        self._cache = {}
+
     def visible(self):
         return True
-    
+
     def get_groups(self):
         return {}
-    
+
     def filter_glyphs(self, font):
-        """Return glyphs that have no Unicode codepoint defined."""
-        results = []
-        
+        """Return unencoded glyphs, cached per font fingerprint."""
+        key = font_fingerprint(font)
+        entry = self._cache.get(key)
+        if entry is None:
+            # Late import: fused imports this module at load time
+            from .fused import compute_general_filters
+
+            results = compute_general_filters(font)[self.keyword]
+            entry = [{r["glyph_name"] for r in results}, results]
+            if len(self._cache) >= 4:
+                # Evict the oldest entry (insertion order)
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = entry
+        if entry[1] is None:
+            # Rebuilt lazily after update_glyph patched the name set
+            entry[1] = [{"glyph_name": n} for n in sorted(entry[0])]
+        return entry[1]
+
+    def update_glyph(self, font, glyph_name, encoded):
+        """
+        Patch the cached result for a single glyph's encoding change.
+
+        Hosts that track per-glyph edits can call this instead of
+        letting the next filter_glyphs call rescan the whole font: the
+        unencoded name set is adjusted in O(1) and the result list is
+        rebuilt (sorted) on the next query.
+
+        Args:
+            font: The font object the change belongs to
+            glyph_name: Name of the changed glyph
+            encoded: True if the glyph now has a codepoint
+        """
+        entry = self._cache.get(font_fingerprint(font))
+        if entry is None:
+            return
+        if encoded:
+            entry[0].discard(glyph_name)
+        else:
+            entry[0].add(glyph_name)
+        entry[1] = None
+
+    def iter_filter_glyphs(self, font):
+        """
+        Yield filter results one glyph at a time.
+
+        Serves from the per-font cache when warm; otherwise streams the
+        scan so consumers that iterate once never hold the full result
+        list. Streamed results are not cached since the consumer may
+        stop early.
+        """
+        entry = self._cache.get(font_fingerprint(font))
+        if entry is not None:
+            if entry[1] is None:
+                entry[1] = [{"glyph_name": n} for n in sorted(entry[0])]
+            yield from entry[1]
+        else:
+            yield from self._iter_scan(font)
+
+    def _scan_glyphs(self, font):
+        """Scan the font and build the result list."""
+        return list(self._iter_scan(font))
+
+    def _iter_scan(self, font):
+        """Scan the font, yielding one result dict per glyph."""
         glyphs = getattr(font, 'glyphs', None)
         if glyphs is None:
-            return results
-        
+            return
+
+        # Bind per-iteration lookups once; getattr keeps its default so
+        # proxy objects without the attribute stay harmless
+        _getattr = getattr
         for glyph in glyphs:
-            glyph_name = getattr(glyph, 'name', None)
+            glyph_name = _getattr(glyph, 'name', None)
             if not glyph_name:
                 continue
-            
+
             # Check for unicode codepoints
-            codepoints = getattr(glyph, 'codepoints', None)
+            codepoints = _getattr(glyph, 'codepoints', None)
             if not codepoints or len(codepoints) == 0:
-                results.append({"glyph_name": glyph_name})
-        
-        return results
+                yield {"glyph_name": glyph_name}
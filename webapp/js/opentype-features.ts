@@ -189,12 +189,6 @@ export const DEFAULT_OFF_FEATURES = new Set([
     'zero' // Slashed Zero
 ]);
 
-// All discretionary features (on by default + off by default)
-export const DISCRETIONARY_FEATURES = new Set([
-    ...DEFAULT_ON_FEATURES,
-    ...DEFAULT_OFF_FEATURES
-]);
-
 // Features that are required (not subject to user control, always applied)
 export const REQUIRED_FEATURES = new Set([
     'abvf', // Above-base Forms
@@ -240,8 +234,49 @@ export const REQUIRED_FEATURES = new Set([
     'vatu' // Vattu Variants
 ]);
 
-// Feature descriptions for documentation purposes
-export const FEATURE_DESCRIPTIONS: Record<string, string> = {
+// Features that are effectively active when the user has not touched
+// anything: required features plus the discretionary on-by-default
+// ones. Shared so callers don't rebuild this union per query.
+export const ACTIVE_BY_DEFAULT_FEATURES = new Set([
+    ...REQUIRED_FEATURES,
+    ...DEFAULT_ON_FEATURES
+]);
+
+// Category bitmask values for FEATURE_CATEGORIES
+export const CATEGORY_DISCRETIONARY = 1;
+export const CATEGORY_DEFAULT_ON = 2;
+export const CATEGORY_REQUIRED = 4;
+
+// One lookup answering every category predicate at once: callers that
+// need both "discretionary?" and "default on?" hash the tag a single
+// time and test bits on the result
+export const FEATURE_CATEGORIES: Map<string, number> = (() => {
+    const categories = new Map<string, number>();
+    for (const tag of DEFAULT_ON_FEATURES) {
+        categories.set(tag, CATEGORY_DISCRETIONARY | CATEGORY_DEFAULT_ON);
+    }
+    for (const tag of DEFAULT_OFF_FEATURES) {
+        categories.set(tag, CATEGORY_DISCRETIONARY);
+    }
+    for (const tag of REQUIRED_FEATURES) {
+        categories.set(tag, CATEGORY_REQUIRED);
+    }
+    return categories;
+})();
+
+/**
+ * Get the category bitmask of a feature tag.
+ *
+ * @param featureTag - Four-character OpenType feature tag
+ * @returns Combination of CATEGORY_* bits, or 0 for unknown tags
+ */
+export function getFeatureCategory(featureTag: string): number {
+    return FEATURE_CATEGORIES.get(featureTag) ?? 0;
+}
+
+// Feature descriptions for documentation purposes. Frozen: the table
+// is shared by reference with every getOpentypeFeatureInfo consumer
+export const FEATURE_DESCRIPTIONS: Record<string, string> = Object.freeze({
     // Discretionary features (on by default)
     calt: 'Contextual Alternates - Replaces default glyphs with alternate forms in specified contexts',
     clig: 'Contextual Ligatures - Replaces sequences with ligatures in specified contexts',
@@ -297,20 +332,65 @@ export const FEATURE_DESCRIPTIONS: Record<string, string> = {
     twid: 'Third Widths - Replaces glyphs with third-width variants',
     unic: 'Unicase - Replaces glyphs with unicase forms',
     zero: 'Slashed Zero - Replaces standard zero with slashed zero'
-};
+});
+
+/**
+ * Compute the description for a templated cvNN / ssNN tag on demand,
+ * instead of materializing all 119 strings at module load.
+ *
+ * @param featureTag - Four-character OpenType feature tag
+ * @returns Description string, or undefined if the tag is not templated
+ */
+const templatedDescriptionCache = new Map<string, string | undefined>();
 
-// Add descriptions for character variant features
-for (let i = 1; i <= 99; i++) {
-    const cvTag = `cv${i.toString().padStart(2, '0')}`;
-    FEATURE_DESCRIPTIONS[cvTag] =
-        `Character Variant ${i} - Provides glyph variants for specific characters`;
+function templatedFeatureDescription(featureTag: string): string | undefined {
+    if (featureTag.length !== 4) {
+        return undefined;
+    }
+    if (templatedDescriptionCache.has(featureTag)) {
+        return templatedDescriptionCache.get(featureTag);
+    }
+    const description = computeTemplatedDescription(featureTag);
+    templatedDescriptionCache.set(featureTag, description);
+    return description;
 }
 
-// Add descriptions for stylistic set features
-for (let i = 1; i <= 20; i++) {
-    const ssTag = `ss${i.toString().padStart(2, '0')}`;
-    FEATURE_DESCRIPTIONS[ssTag] =
-        `Stylistic Set ${i} - Applies stylistic variant glyphs as a set`;
+// Compiled once; matches the two templated tag families
+const TEMPLATED_TAG_PATTERN = /^(cv|ss)(\d\d)$/;
+
+function computeTemplatedDescription(featureTag: string): string | undefined {
+    const match = TEMPLATED_TAG_PATTERN.exec(featureTag);
+    if (!match) {
+        return undefined;
+    }
+    const n = Number(match[2]);
+    if (match[1] === 'cv' && n >= 1) {
+        return `Character Variant ${n} - Provides glyph variants for specific characters`;
+    }
+    if (match[1] === 'ss' && n >= 1 && n <= 20) {
+        return `Stylistic Set ${n} - Applies stylistic variant glyphs as a set`;
+    }
+    return undefined;
+}
+
+// Full description table including the templated entries, built once
+// on first use by getOpentypeFeatureInfo
+let fullFeatureDescriptions: Record<string, string> | null = null;
+
+function allFeatureDescriptions(): Record<string, string> {
+    if (!fullFeatureDescriptions) {
+        const full: Record<string, string> = { ...FEATURE_DESCRIPTIONS };
+        for (let i = 1; i <= 99; i++) {
+            const cvTag = `cv${i.toString().padStart(2, '0')}`;
+            full[cvTag] = templatedFeatureDescription(cvTag)!;
+        }
+        for (let i = 1; i <= 20; i++) {
+            const ssTag = `ss${i.toString().padStart(2, '0')}`;
+            full[ssTag] = templatedFeatureDescription(ssTag)!;
+        }
+        fullFeatureDescriptions = Object.freeze(full);
+    }
+    return fullFeatureDescriptions;
 }
 
 /**
@@ -320,7 +400,12 @@ for (let i = 1; i <= 20; i++) {
  * @returns True if the feature is discretionary, False if required
  */
 export function isDiscretionary(featureTag: string): boolean {
-    return DISCRETIONARY_FEATURES.has(featureTag);
+    // Checked against both component sets rather than a materialized
+    // union; the much larger off-by-default set is probed first
+    return (
+        DEFAULT_OFF_FEATURES.has(featureTag) ||
+        DEFAULT_ON_FEATURES.has(featureTag)
+    );
 }
 
 /**
@@ -341,7 +426,11 @@ export function isDefaultOn(featureTag: string): boolean {
  * @returns Description string, or empty string if not found
  */
 export function getFeatureDescription(featureTag: string): string {
-    return FEATURE_DESCRIPTIONS[featureTag] || '';
+    return (
+        FEATURE_DESCRIPTIONS[featureTag] ||
+        templatedFeatureDescription(featureTag) ||
+        ''
+    );
 }
 
 export interface OpentypeFeatureInfo {
@@ -368,6 +457,6 @@ export function getOpentypeFeatureInfo(): OpentypeFeatureInfo {
     return {
         default_on: Array.from(DEFAULT_ON_FEATURES),
         default_off: Array.from(DEFAULT_OFF_FEATURES),
-        descriptions: FEATURE_DESCRIPTIONS
+        descriptions: allFeatureDescriptions()
     };
 }
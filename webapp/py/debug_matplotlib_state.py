@@ -15,8 +15,13 @@ try:
     gc_count = gc.get_count()
     print(f"GC stats - generation counts: {gc_count}")
     
-    # Check for matplotlib objects in memory
-    matplotlib_objects = [obj for obj in gc.get_objects() if 'matplotlib' in str(type(obj))]
+    # Check for matplotlib objects in memory. Scan only the oldest GC
+    # generation (long-lived leaks end up there) and match on the
+    # type's module instead of formatting str(type(obj)) per object
+    matplotlib_objects = [
+        obj for obj in gc.get_objects(2)
+        if getattr(type(obj), '__module__', '').startswith('matplotlib')
+    ]
     print(f"Total matplotlib objects in memory: {len(matplotlib_objects)}")
     
     # Close all figures
@@ -21,6 +21,11 @@ Core functionality for font editing operations
 import js
 import pyodide.ffi
 
+# Bound once: every js.X.Y access walks the JsProxy __getattr__ chain,
+# so hot call sites read these module locals instead
+_JsNull = pyodide.ffi.JsNull
+_window = js.window
+
 
 def CurrentFont():
     """
@@ -36,7 +41,8 @@ def CurrentFont():
         >>> font = CurrentFont()
         >>> print(font.info.familyName)
     """
-    if type(js.window.currentFontModel) is pyodide.ffi.JsNull:
+    model = _window.currentFontModel
+    if type(model) is _JsNull:
         raise RuntimeError("No font is currently open")
-    return js.window.currentFontModel
+    return model
 
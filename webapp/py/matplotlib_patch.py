@@ -1,37 +1,98 @@
 # Matplotlib auto-cleanup patch
 # Automatically close all figures after plt.show() to prevent memory accumulation
 
+import importlib.abc
+import importlib.util
 import sys
 
-# Always try to patch if matplotlib is imported
-try:
-    import matplotlib.pyplot as plt
-    
+# Status prints cross the JS console bridge synchronously at import
+# time; keep them off unless debugging the patch itself
+_DEBUG = False
+
+
+def _patch_pyplot(plt):
     # Check if already patched
-    if not hasattr(plt.show, '_autopatch_applied'):
-        # Store the original show function
-        _original_show = plt.show
-        
-        # Create a wrapper that closes all figures after showing
-        def show_and_close(*args, **kwargs):
-            """Show plots and automatically close all figures to free memory"""
-            result = _original_show(*args, **kwargs)
-            # Close all figures after showing
-            plt.close('all')
-            return result
-        
-        # Mark as patched
-        show_and_close._autopatch_applied = True
-        
-        # Replace plt.show with our wrapper
-        plt.show = show_and_close
-        
+    if hasattr(plt.show, '_autopatch_applied'):
+        if _DEBUG:
+            print("[MatplotlibPatch] ⏭️ Patch already applied, skipping")
+        return
+
+    # Create a wrapper that closes all figures after showing.
+    # The default arguments bind the patched-over functions once,
+    # so each call runs on local loads only
+    def show_and_close(*args, _show=plt.show, _close=plt.close,
+                       _fignums=plt.get_fignums, **kwargs):
+        """Show plots and automatically close all figures to free memory"""
+        result = _show(*args, **kwargs)
+        # Close figures only when any exist: close('all') walks the
+        # figure registry and dispatches a destroy per manager even
+        # when it is empty
+        if _fignums():
+            _close('all')
+        return result
+
+    # Mark as patched
+    show_and_close._autopatch_applied = True
+
+    # Replace plt.show with our wrapper
+    plt.show = show_and_close
+
+    if _DEBUG:
         print("[MatplotlibPatch] ✅ Installed auto-cleanup patch for plt.show()")
+
+
+class _PyplotPatchLoader(importlib.abc.Loader):
+    # Wraps pyplot's real loader so the patch lands right after the
+    # module body has executed
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+        try:
+            _patch_pyplot(module)
+        except Exception as e:
+            print(f"[MatplotlibPatch] ❌ Failed to patch matplotlib: {e}")
+
+
+class _PyplotPatchHook(importlib.abc.MetaPathFinder):
+    # One-shot import hook: this file runs right after the package
+    # install, before the user's code has imported pyplot, so there is
+    # nothing to patch yet. The hook waits for the first
+    # 'matplotlib.pyplot' import, wraps its loader, and removes itself.
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != 'matplotlib.pyplot':
+            return None
+        # Drop out of meta_path first so the find_spec below resolves
+        # through the regular finders instead of recursing
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _PyplotPatchLoader(spec.loader)
+        return spec
+
+
+try:
+    plt = sys.modules.get('matplotlib.pyplot')
+
+    if plt is not None:
+        # Already imported (e.g. this file re-runs after user code):
+        # patch in place
+        _patch_pyplot(plt)
+    elif any(type(f).__name__ == '_PyplotPatchHook' for f in sys.meta_path):
+        # This file runs once per install request; a hook from an
+        # earlier run is still waiting, so don't stack another
+        if _DEBUG:
+            print("[MatplotlibPatch] ⏭️ Import hook already installed, skipping")
     else:
-        print("[MatplotlibPatch] ⏭️ Patch already applied, skipping")
-        
-except ImportError:
-    # Matplotlib not loaded yet, that's fine
-    print("[MatplotlibPatch] ⚠️ Matplotlib not yet imported, patch will wait")
+        sys.meta_path.insert(0, _PyplotPatchHook())
+        if _DEBUG:
+            print("[MatplotlibPatch] ⚠️ Matplotlib not yet imported, patch will apply on import")
+
 except Exception as e:
     print(f"[MatplotlibPatch] ❌ Failed to patch matplotlib: {e}")